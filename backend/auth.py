@@ -3,6 +3,7 @@ Authentication middleware for the Python backend.
 Verifies JWT tokens from Next.js NextAuth sessions.
 """
 import os
+import time
 import jwt
 from typing import Optional
 from fastapi import HTTPException, Header
@@ -10,12 +11,33 @@ from fastapi import HTTPException, Header
 # This should match NEXTAUTH_SECRET in frontend .env
 NEXTAUTH_SECRET = os.getenv("NEXTAUTH_SECRET", "listify-secret-key-change-in-production")
 
+# Verified payloads cached per raw token so repeated requests with the same
+# session skip the HMAC + base64 work. Keying on the token means a cache
+# hit is by definition a token whose signature already verified; only the
+# exp claim needs re-checking (cheap integer compare).
+_TOKEN_CACHE: dict[str, tuple[dict, float]] = {}
+_TOKEN_CACHE_TTL = 60  # seconds
+_TOKEN_CACHE_MAX = 4096
+
 
 def decode_session_token(token: str) -> Optional[dict]:
     """
     Decode and verify a NextAuth JWT session token.
     Returns the decoded payload if valid, None otherwise.
     """
+    now = time.time()
+
+    cached = _TOKEN_CACHE.get(token)
+    if cached is not None:
+        payload, cached_at = cached
+        if now - cached_at < _TOKEN_CACHE_TTL:
+            exp = payload.get("exp")
+            if exp is not None and exp < now:
+                _TOKEN_CACHE.pop(token, None)
+                raise HTTPException(status_code=401, detail="Session expired")
+            return payload
+        _TOKEN_CACHE.pop(token, None)
+
     try:
         # NextAuth uses HS256 by default
         payload = jwt.decode(
@@ -24,12 +46,19 @@ def decode_session_token(token: str) -> Optional[dict]:
             algorithms=["HS256"],
             options={"verify_exp": True}
         )
-        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Session expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid session token")
 
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+        # Bounded cache: drop the oldest half when full
+        for key in list(_TOKEN_CACHE)[:_TOKEN_CACHE_MAX // 2]:
+            _TOKEN_CACHE.pop(key, None)
+    _TOKEN_CACHE[token] = (payload, now)
+
+    return payload
+
 
 async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     """
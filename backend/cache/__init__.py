@@ -7,12 +7,26 @@ from .file_cache import (
     get_cached_result,
     save_to_cache,
     clear_cache,
-    get_file_hash
+    get_file_hash,
+    hash_files_parallel
+)
+from .pipeline_cache import (
+    get_cached_pipeline,
+    save_pipeline_to_cache,
+    content_cache_key,
+    get_cached_content,
+    save_content_to_cache
 )
 
 __all__ = [
     'get_cached_result',
     'save_to_cache',
     'clear_cache',
-    'get_file_hash'
+    'get_file_hash',
+    'hash_files_parallel',
+    'get_cached_pipeline',
+    'save_pipeline_to_cache',
+    'content_cache_key',
+    'get_cached_content',
+    'save_content_to_cache'
 ]
@@ -0,0 +1,161 @@
+"""
+Pipeline Cache Module
+Caches keyed on upload content: full-pipeline results by image hash (so
+re-uploads skip the LLM and 3D services entirely) and generated listing
+copy by (niche, labels, price bucket) so similar products reuse it
+"""
+from typing import Optional, Dict, Any
+import hashlib
+import logging
+
+import orjson
+
+from backend.database import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+_CACHE_TABLES_SQL = """
+    CREATE TABLE IF NOT EXISTS pipeline_cache (
+        hash TEXT PRIMARY KEY,
+        payload BLOB NOT NULL,
+        created_at INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS content_cache (
+        key TEXT PRIMARY KEY,
+        payload BLOB NOT NULL,
+        created_at INTEGER NOT NULL
+    );
+"""
+
+_table_ready = False
+
+
+def _cache_conn():
+    """Database connection with the cache tables ensured."""
+    global _table_ready
+    conn = get_db_connection()
+    if not _table_ready:
+        conn.executescript(_CACHE_TABLES_SQL)
+        conn.commit()
+        _table_ready = True
+    return conn
+
+
+async def get_cached_pipeline(image_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve a cached pipeline output (analysis + price + content + 3D
+    assets) for an image content hash.
+
+    Args:
+        image_hash: SHA256 hex digest of the uploaded image
+
+    Returns:
+        dict | None: Cached pipeline output, or None if not in cache
+    """
+    try:
+        conn = _cache_conn()
+        row = conn.execute(
+            "SELECT payload FROM pipeline_cache WHERE hash = ?",
+            (image_hash,)
+        ).fetchone()
+
+        if row is not None:
+            logger.info("[PipelineCache] ✓ Hit: %s...", image_hash[:8])
+            return orjson.loads(row["payload"])
+
+        logger.debug("[PipelineCache] Miss: %s...", image_hash[:8])
+        return None
+
+    except Exception as e:
+        logger.warning("[PipelineCache] Error reading cache: %s", e)
+        return None
+
+
+async def save_pipeline_to_cache(image_hash: str, pipeline_output: Dict[str, Any]) -> None:
+    """
+    Save a complete pipeline output for an image content hash.
+
+    Args:
+        image_hash: SHA256 hex digest of the uploaded image
+        pipeline_output: Dict with image_analysis, price, content and
+            assets_3d sections
+    """
+    try:
+        conn = _cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO pipeline_cache (hash, payload, created_at) "
+            "VALUES (?, ?, strftime('%s','now'))",
+            (image_hash, orjson.dumps(pipeline_output))
+        )
+        conn.commit()
+
+        logger.info("[PipelineCache] ✓ Saved: %s...", image_hash[:8])
+
+    except Exception as e:
+        logger.warning("[PipelineCache] Error saving cache: %s", e)
+
+
+# Hot listing copy also lives in memory — most hits never touch SQLite
+_content_mem: Dict[str, Dict[str, Any]] = {}
+_CONTENT_MEM_MAX = 1024
+
+
+def content_cache_key(niche: str, labels: list, price: float) -> str:
+    """
+    Stable cache key for generated listing copy.
+
+    Price is bucketed into $20 bands and only the top labels count, so
+    near-identical products in the same niche share an entry.
+    """
+    return hashlib.blake2b(orjson.dumps({
+        "niche": niche,
+        "labels": sorted(labels[:8]),
+        "price_bucket": int(price // 20)
+    })).hexdigest()
+
+
+async def get_cached_content(key: str) -> Optional[Dict[str, Any]]:
+    """Retrieve cached listing copy, or None on miss."""
+    cached = _content_mem.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        conn = _cache_conn()
+        row = conn.execute(
+            "SELECT payload FROM content_cache WHERE key = ?",
+            (key,)
+        ).fetchone()
+
+        if row is not None:
+            logger.info("[ContentCache] ✓ Hit: %s...", key[:8])
+            content = orjson.loads(row["payload"])
+            _content_mem[key] = content
+            return content
+
+        return None
+
+    except Exception as e:
+        logger.warning("[ContentCache] Error reading cache: %s", e)
+        return None
+
+
+async def save_content_to_cache(key: str, content: Dict[str, Any]) -> None:
+    """Save generated listing copy under its content key."""
+    if len(_content_mem) >= _CONTENT_MEM_MAX:
+        # Bounded cache: drop the oldest half when full
+        for old_key in list(_content_mem)[:_CONTENT_MEM_MAX // 2]:
+            _content_mem.pop(old_key, None)
+    _content_mem[key] = content
+
+    try:
+        conn = _cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO content_cache (key, payload, created_at) "
+            "VALUES (?, ?, strftime('%s','now'))",
+            (key, orjson.dumps(content))
+        )
+        conn.commit()
+
+    except Exception as e:
+        logger.warning("[ContentCache] Error saving cache: %s", e)
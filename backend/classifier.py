@@ -1,33 +1,136 @@
+import functools
+
+try:
+    import ahocorasick  # pyahocorasick: optional, pure-Python fallback below
+except ImportError:
+    ahocorasick = None
+
 from backend.database import get_db_connection
 
+# The keywords table only changes through the feedback learning path, so
+# keep an in-memory snapshot of keywords x niches and rebuild it (plus bump
+# the version so cached classifications stop matching) on invalidation.
+_keywords_version = 0
+_keywords_snapshot: list[tuple[str, float, int, str]] | None = None
+_keywords_automaton = None
+
+SNAPSHOT_SQL = """
+    SELECT k.keyword, k.weight, n.id AS niche_id, n.name AS niche_name
+    FROM keywords k
+    JOIN niches n ON n.id = k.niche_id
+"""
+
+
+def invalidate_keywords_cache() -> None:
+    """Signal that the keywords table changed; snapshot and results go stale."""
+    global _keywords_version, _keywords_snapshot, _keywords_automaton
+    _keywords_version += 1
+    _keywords_snapshot = None
+    _keywords_automaton = None
+
+
+def _get_keywords_snapshot() -> list[tuple[str, float, int, str]]:
+    """Load (keyword, weight, niche_id, niche_name) rows, cached in memory."""
+    global _keywords_snapshot
+    if _keywords_snapshot is None:
+        conn = get_db_connection()
+        rows = conn.execute(SNAPSHOT_SQL).fetchall()
+        _keywords_snapshot = [
+            (r["keyword"], r["weight"], r["niche_id"], r["niche_name"])
+            for r in rows
+        ]
+    return _keywords_snapshot
+
+
+def _get_keyword_automaton():
+    """
+    Aho-Corasick automaton over all keywords, mapping each keyword to the
+    snapshot row indices that carry it (a keyword can belong to several
+    niches). Rebuilt lazily after invalidation.
+    """
+    global _keywords_automaton
+    if _keywords_automaton is None:
+        automaton = ahocorasick.Automaton()
+        for idx, (keyword, _, _, _) in enumerate(_get_keywords_snapshot()):
+            if keyword in automaton:
+                automaton.get(keyword).append(idx)
+            else:
+                automaton.add_word(keyword, [idx])
+        automaton.make_automaton()
+        _keywords_automaton = automaton
+    return _keywords_automaton
+
+
+def _score_labels(labels: tuple[str, ...]) -> dict[int, dict]:
+    """Score niches by bidirectional substring match against the snapshot."""
+    snapshot = _get_keywords_snapshot()
+
+    if ahocorasick is not None:
+        # Each (label, keyword row) pair scores at most once, matching the
+        # original `keyword in label or label in keyword` semantics
+        matched_pairs: set[tuple[str, int]] = set()
+
+        # Direction 1: keywords contained in labels — one DFA scan per label
+        keyword_automaton = _get_keyword_automaton()
+        for label in labels:
+            for _, indices in keyword_automaton.iter(label):
+                for idx in indices:
+                    matched_pairs.add((label, idx))
+
+        # Direction 2: labels contained in keywords — build a small
+        # automaton over this call's labels and scan each keyword once
+        label_automaton = ahocorasick.Automaton()
+        for label in labels:
+            if label:
+                label_automaton.add_word(label, label)
+        label_automaton.make_automaton()
+        for idx, (keyword, _, _, _) in enumerate(snapshot):
+            for _, label in label_automaton.iter(keyword):
+                matched_pairs.add((label, idx))
+
+        niche_scores: dict[int, dict] = {}
+        for _, idx in matched_pairs:
+            _, weight, niche_id, niche_name = snapshot[idx]
+            if niche_id not in niche_scores:
+                niche_scores[niche_id] = {"name": niche_name, "score": 0}
+            niche_scores[niche_id]["score"] += weight
+        return niche_scores
+
+    # Pure-Python fallback when pyahocorasick isn't installed. Kept as a
+    # tight loop: accumulate into flat dicts so each match costs two
+    # substring checks (C-level str __contains__) and one dict update,
+    # instead of nested-dict bookkeeping per hit.
+    scores: dict[int, float] = {}
+    names: dict[int, str] = {}
+    get_score = scores.get
+    for label in labels:
+        for keyword, weight, niche_id, niche_name in snapshot:
+            # Simple partial match
+            if keyword in label or label in keyword:
+                scores[niche_id] = get_score(niche_id, 0.0) + weight
+                names[niche_id] = niche_name
+    return {
+        niche_id: {"name": names[niche_id], "score": score}
+        for niche_id, score in scores.items()
+    }
+
+
 def classify_product(labels: list[str]) -> dict:
     """
     Classifies a product into a niche based on detected labels.
     Returns a dictionary with the niche name and confidence score.
+
+    Results are memoized per (label set, keywords version): Vision tends to
+    return identical label sets for similar products, and the result only
+    changes when the keywords table does.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Get all keywords and their associated niches
-    cursor.execute("SELECT k.keyword, k.weight, n.id as niche_id, n.name as niche_name FROM keywords k JOIN niches n ON k.niche_id = n.id")
-    keywords_db = cursor.fetchall()
-    
-    niche_scores = {}
-    
-    for label in labels:
-        for row in keywords_db:
-            # Simple partial match
-            if row['keyword'] in label or label in row['keyword']:
-                niche_id = row['niche_id']
-                niche_name = row['niche_name']
-                weight = row['weight']
-                
-                if niche_id not in niche_scores:
-                    niche_scores[niche_id] = {"name": niche_name, "score": 0}
-                
-                niche_scores[niche_id]["score"] += weight
-
-    conn.close()
+    result = _classify_cached(tuple(sorted(labels)), _keywords_version)
+    return dict(result)  # copy so callers can't mutate the cached entry
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_cached(labels_key: tuple[str, ...], version: int) -> dict:
+    niche_scores = _score_labels(labels_key)
 
     if not niche_scores:
         return {"niche": "Unknown", "confidence": 0.0, "niche_id": None}
@@ -35,11 +138,11 @@ def classify_product(labels: list[str]) -> dict:
     # Find the niche with the highest score
     best_niche_id = max(niche_scores, key=lambda k: niche_scores[k]["score"])
     best_niche = niche_scores[best_niche_id]
-    
+
     # Normalize score (simple heuristic)
     total_score = sum(n["score"] for n in niche_scores.values())
     confidence = best_niche["score"] / total_score if total_score > 0 else 0.0
-    
+
     return {
         "niche": best_niche["name"],
         "confidence": round(confidence, 2),
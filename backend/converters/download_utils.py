@@ -13,12 +13,43 @@ logger = logging.getLogger(__name__)
 # Optimal chunk size for streaming (4MB)
 CHUNK_SIZE = 4 * 1024 * 1024
 
+# Coalesce writes so each aiofiles call (one thread-pool hop + one write
+# syscall) covers several network chunks
+WRITE_COALESCE_SIZE = 16 * 1024 * 1024
+
+# Shared session so concurrent/repeated downloads reuse TCP+TLS connections
+# instead of paying the handshake per file
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Lazily create the module-wide ClientSession (needs a running loop)."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                keepalive_timeout=60
+            )
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (app shutdown hook)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 
 async def download_file_streaming(
-    url: str, 
+    url: str,
     dest_path: str,
     chunk_size: int = CHUNK_SIZE,
-    timeout: int = 300
+    timeout: int = 300,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> str:
     """
     Download large files using async streaming to avoid loading entire file into memory.
@@ -28,7 +59,8 @@ async def download_file_streaming(
         dest_path: Destination file path
         chunk_size: Size of chunks to download (default: 4MB)
         timeout: Request timeout in seconds (default: 5 minutes)
-        
+        session: Optional ClientSession to reuse (defaults to shared one)
+
     Returns:
         str: Path to downloaded file
         
@@ -36,45 +68,63 @@ async def download_file_streaming(
         aiohttp.ClientError: If download fails
         IOError: If file write fails
     """
-    logger.info(f"[Download] Starting streaming download: {url}")
+    logger.info("[Download] Starting streaming download: %s", url)
     
     # Ensure destination directory exists
     Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
     
     timeout_config = aiohttp.ClientTimeout(total=timeout)
-    
+
     try:
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise aiohttp.ClientError(
-                        f"Download failed with status {response.status}: {url}"
-                    )
-                
-                # Get file size if available
-                file_size = response.headers.get('Content-Length')
+        if session is None:
+            session = _get_session()
+        async with session.get(url, timeout=timeout_config) as response:
+            if response.status != 200:
+                raise aiohttp.ClientError(
+                    f"Download failed with status {response.status}: {url}"
+                )
+
+            # Get file size if available
+            file_size = response.headers.get('Content-Length')
+            if file_size:
+                file_size_mb = int(file_size) / (1024 * 1024)
+                logger.info("[Download] File size: %.2fMB", file_size_mb)
+
+            # Stream download in chunks
+            downloaded = 0
+            async with aiofiles.open(dest_path, 'wb') as f:
                 if file_size:
-                    file_size_mb = int(file_size) / (1024 * 1024)
-                    logger.info(f"[Download] File size: {file_size_mb:.2f}MB")
-                
-                # Stream download in chunks
-                downloaded = 0
-                async with aiofiles.open(dest_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(chunk_size):
-                        await f.write(chunk)
-                        downloaded += len(chunk)
-                
-                # Log completion
-                downloaded_mb = downloaded / (1024 * 1024)
-                logger.info(f"[Download] ✓ Completed: {downloaded_mb:.2f}MB → {dest_path}")
-                
-                return dest_path
-                
+                    # Preallocate so the filesystem reserves contiguous
+                    # extents up front instead of growing per chunk
+                    await f.truncate(int(file_size))
+                pending = []
+                pending_size = 0
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    downloaded += len(chunk)
+                    if pending_size >= WRITE_COALESCE_SIZE:
+                        await f.write(b''.join(pending))
+                        pending.clear()
+                        pending_size = 0
+                if pending:
+                    await f.write(b''.join(pending))
+                if file_size and downloaded != int(file_size):
+                    # Server lied about Content-Length — trim to what we got
+                    await f.truncate(downloaded)
+
+            # Log completion
+            downloaded_mb = downloaded / (1024 * 1024)
+            logger.info("[Download] ✓ Completed: %.2fMB → %s", downloaded_mb, dest_path)
+
+            return dest_path
+
+
     except aiohttp.ClientError as e:
-        logger.error(f"[Download] ✗ Network error: {str(e)}")
+        logger.error("[Download] ✗ Network error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"[Download] ✗ Unexpected error: {str(e)}")
+        logger.error("[Download] ✗ Unexpected error: %s", e)
         raise
 
 
@@ -99,11 +149,12 @@ async def download_multiple_files(
     
     Path(dest_dir).mkdir(parents=True, exist_ok=True)
     
+    session = _get_session()
     tasks = []
     for i, url in enumerate(urls):
         ext = Path(url).suffix or '.bin'
         dest_path = f"{dest_dir}/{filename_prefix}_{i}{ext}"
-        tasks.append(download_file_streaming(url, dest_path))
+        tasks.append(download_file_streaming(url, dest_path, session=session))
     
     # Download all files concurrently
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -113,6 +164,6 @@ async def download_multiple_files(
         r for r in results if not isinstance(r, Exception)
     ]
     
-    logger.info(f"[Download] Downloaded {len(successful_downloads)}/{len(urls)} files")
+    logger.info("[Download] Downloaded %d/%d files", len(successful_downloads), len(urls))
     
     return successful_downloads
@@ -5,16 +5,195 @@ Generates 360° turntable video from GLB 3D models using trimesh + ffmpeg
 import trimesh
 import numpy as np
 from PIL import Image
+import concurrent.futures
+import functools
 import subprocess
-import uuid
 import os
-import shutil
 import logging
 import io
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Prefer GPU rasterization via pyrender's headless EGL backend; fall back
+# to trimesh's software rasterizer when pyrender/EGL isn't available
+os.environ.setdefault('PYOPENGL_PLATFORM', 'egl')
+try:
+    import pyrender
+    PYRENDER_AVAILABLE = True
+except Exception:
+    pyrender = None
+    PYRENDER_AVAILABLE = False
+
+
+# Software encoder arguments (also the universal fallback)
+_SOFTWARE_ENCODER_ARGS = [
+    '-c:v', 'libx264',
+    '-pix_fmt', 'yuv420p',
+    '-crf', '23',  # Quality (lower = better, 23 is good default)
+    '-preset', 'medium',  # Encoding speed vs compression
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _pick_h264_encoder() -> tuple[str, ...]:
+    """
+    Probe ffmpeg once for a hardware H.264 encoder (NVENC, VideoToolbox,
+    QSV, VAAPI) and return the encoder arguments to use; falls back to
+    libx264 when no hardware encoder is available.
+    """
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True, text=True, check=False, timeout=10
+        )
+        encoders = result.stdout
+    except Exception as e:
+        logger.warning("[GLB→MP4] Encoder probe failed: %s", e)
+        encoders = ''
+
+    if 'h264_nvenc' in encoders:
+        logger.info("[GLB→MP4] Using NVENC hardware encoder")
+        return ('-c:v', 'h264_nvenc', '-pix_fmt', 'yuv420p',
+                '-preset', 'p4', '-rc', 'vbr', '-cq', '23')
+    if 'h264_videotoolbox' in encoders:
+        logger.info("[GLB→MP4] Using VideoToolbox hardware encoder")
+        return ('-c:v', 'h264_videotoolbox', '-pix_fmt', 'yuv420p', '-q:v', '55')
+    if 'h264_qsv' in encoders:
+        logger.info("[GLB→MP4] Using QuickSync hardware encoder")
+        return ('-c:v', 'h264_qsv', '-pix_fmt', 'yuv420p', '-global_quality', '23')
+    if 'h264_vaapi' in encoders and os.path.exists('/dev/dri/renderD128'):
+        logger.info("[GLB→MP4] Using VAAPI hardware encoder")
+        return ('-vaapi_device', '/dev/dri/renderD128',
+                '-vf', 'format=nv12,hwupload', '-c:v', 'h264_vaapi', '-qp', '23')
+
+    return tuple(_SOFTWARE_ENCODER_ARGS)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_scene(glb_path: str):
+    """Load a GLB into a trimesh scene (cached per process)."""
+    mesh = trimesh.load(glb_path, force='mesh')
+    return mesh.scene()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_offscreen_renderer(width: int, height: int):
+    """One EGL offscreen renderer per process, reused across frames."""
+    return pyrender.OffscreenRenderer(width, height)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_pyrender_scene(glb_path: str):
+    """
+    Build a pyrender scene once per process: mesh uploaded to the GPU a
+    single time, plus camera and light nodes whose poses are updated
+    per frame instead of re-uploading geometry.
+    """
+    mesh = trimesh.load(glb_path, force='mesh')
+    scene = pyrender.Scene(
+        bg_color=[1.0, 1.0, 1.0, 1.0],
+        ambient_light=[0.35, 0.35, 0.35]
+    )
+    scene.add(pyrender.Mesh.from_trimesh(mesh))
+
+    centroid = mesh.bounding_box.centroid
+    radius = float(mesh.bounding_box.extents.max()) * 2.2
+
+    camera = pyrender.PerspectiveCamera(yfov=np.pi / 3.0)
+    camera_node = scene.add(camera, pose=np.eye(4))
+    light = pyrender.DirectionalLight(color=np.ones(3), intensity=3.0)
+    light_node = scene.add(light, pose=np.eye(4))
+
+    return scene, camera_node, light_node, centroid, radius
+
+
+def _camera_pose(centroid, radius: float, angle_rad: float):
+    """Look-at pose for a camera orbiting the centroid around the Y axis."""
+    eye = centroid + np.array([
+        radius * np.sin(angle_rad),
+        0.35 * radius,
+        radius * np.cos(angle_rad)
+    ])
+    forward = centroid - eye
+    forward = forward / np.linalg.norm(forward)
+    right = np.cross(forward, [0.0, 1.0, 0.0])
+    right = right / np.linalg.norm(right)
+    up = np.cross(right, forward)
+
+    pose = np.eye(4)
+    # pyrender cameras look down -Z
+    pose[:3, 0] = right
+    pose[:3, 1] = up
+    pose[:3, 2] = -forward
+    pose[:3, 3] = eye
+    return pose
+
+
+def _render_frames_gpu(
+    glb_path: str,
+    indices: list[int],
+    num_frames: int,
+    resolution: tuple[int, int]
+) -> list[tuple[int, bytes | None]]:
+    """Render frames on the GPU; only the camera/light poses change."""
+    scene, camera_node, light_node, centroid, radius = _load_pyrender_scene(glb_path)
+    renderer = _get_offscreen_renderer(*resolution)
+
+    frames = []
+    for i in indices:
+        angle = np.radians((i / num_frames) * 360)
+        pose = _camera_pose(centroid, radius, angle)
+        scene.set_pose(camera_node, pose)
+        scene.set_pose(light_node, pose)
+        color, _ = renderer.render(scene)
+        frames.append((i, np.ascontiguousarray(color[:, :, :3]).tobytes()))
+    return frames
+
+
+def _render_frame_range(
+    glb_path: str,
+    indices: list[int],
+    num_frames: int,
+    resolution: tuple[int, int]
+) -> list[tuple[int, bytes | None]]:
+    """
+    Render a slice of turntable frames. Runs in a worker process; each
+    worker loads the mesh once (lru_cache) and renders its slice.
+
+    Returns (frame_index, rgb24_bytes) pairs sized to the resolution;
+    rgb24_bytes is None on failure.
+    """
+    if PYRENDER_AVAILABLE:
+        try:
+            return _render_frames_gpu(glb_path, indices, num_frames, resolution)
+        except Exception as e:
+            logger.warning("[GLB→MP4] GPU render unavailable (%s), using CPU rasterizer", e)
+
+    scene = _load_scene(glb_path)
+    centroid = scene.centroid
+    radius = float(scene.extents.max()) * 2.2
+    frames = []
+    for i in indices:
+        angle = np.radians((i / num_frames) * 360)  # Full 360° rotation
+
+        # Orbit the camera instead of rotating the model: the vertex
+        # buffer stays untouched across frames, only the view changes
+        scene.camera_transform = _camera_pose(centroid, radius, angle)
+
+        try:
+            png_data = scene.save_image(resolution=list(resolution))
+            # Decode to raw RGB here (in the worker, in parallel) so the
+            # parent can pipe frames straight into ffmpeg
+            img = Image.open(io.BytesIO(png_data)).convert('RGB')
+            if img.size != resolution:
+                img = img.resize(resolution)
+            frames.append((i, img.tobytes()))
+        except Exception as e:
+            logger.warning("[GLB→MP4] Frame %d render failed: %s", i, e)
+            frames.append((i, None))
+    return frames
+
 
 async def glb_to_mp4_simple(
     glb_path: str,
@@ -41,7 +220,7 @@ async def glb_to_mp4_simple(
         FileNotFoundError: If GLB file doesn't exist
         RuntimeError: If rendering or encoding fails
     """
-    logger.info(f"[GLB→MP4] Starting conversion: {glb_path}")
+    logger.info("[GLB→MP4] Starting conversion: %s", glb_path)
     
     if not os.path.exists(glb_path):
         raise FileNotFoundError(f"GLB file not found: {glb_path}")
@@ -52,91 +231,85 @@ async def glb_to_mp4_simple(
     
     def _convert_sync():
         try:
-            # Load GLB model
-            logger.info(f"[GLB→MP4] Loading model...")
-            mesh = trimesh.load(glb_path, force='mesh')
-            
-            # Create scene
-            scene = mesh.scene()
-            
-            # Setup temp directory for frames
-            temp_dir = f"/tmp/glb2mp4_{uuid.uuid4().hex[:8]}"
-            os.makedirs(temp_dir, exist_ok=True)
-            
+            # Render frames with rotation — each frame is an independent
+            # rotation, so fan the work out across all CPU cores
+            logger.info("[GLB→MP4] Rendering %d frames...", num_frames)
+            workers = min(os.cpu_count() or 1, num_frames)
+            slices = [list(range(w, num_frames, workers)) for w in range(workers)]
+
             try:
-                # Render frames with rotation
-                logger.info(f"[GLB→MP4] Rendering {num_frames} frames...")
-                for i in range(num_frames):
-                    angle = (i / num_frames) * 360  # Full 360° rotation
-                    
-                    # Rotation matrix (around Y-axis)
-                    transform = trimesh.transformations.rotation_matrix(
-                        np.radians(angle),
-                        [0, 1, 0],  # Y-axis (vertical)
-                        [0, 0, 0]   # Origin
-                    )
-                    
-                    # Render frame
-                    try:
-                        png_data = scene.save_image(
-                            resolution=list(resolution),
-                            transform=transform
-                        )
-                        
-                        # Save frame
-                        img = Image.open(io.BytesIO(png_data))
-                        frame_path = f"{temp_dir}/frame_{i:04d}.png"
-                        img.save(frame_path)
-                        
-                    except Exception as e:
-                        logger.warning(f"[GLB→MP4] Frame {i} render failed: {e}")
-                        # Use blank frame as fallback
-                        blank = Image.new('RGB', resolution, color='white')
-                        blank.save(f"{temp_dir}/frame_{i:04d}.png")
-                
-                # Check if we have frames
-                frames = sorted([f for f in os.listdir(temp_dir) if f.endswith('.png')])
-                if len(frames) < num_frames * 0.5:  # At least 50% frames must exist
-                    raise RuntimeError(f"Too many frame rendering failures: {len(frames)}/{num_frames}")
-                
-                # Ensure output directory exists
-                Path(output_mp4).parent.mkdir(parents=True, exist_ok=True)
-                
-                # Convert frames to MP4 using ffmpeg
-                logger.info(f"[GLB→MP4] Encoding video with ffmpeg...")
-                result = subprocess.run([
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_render_frame_range, glb_path, s, num_frames, resolution)
+                        for s in slices
+                    ]
+                    rendered = [
+                        frame
+                        for fut in concurrent.futures.as_completed(futures)
+                        for frame in fut.result()
+                    ]
+            except Exception as e:
+                # Process pool can fail if the render backend doesn't
+                # survive fork/spawn — fall back to in-process rendering
+                logger.warning("[GLB→MP4] Parallel render unavailable (%s), rendering serially", e)
+                rendered = _render_frame_range(glb_path, list(range(num_frames)), num_frames, resolution)
+
+            rendered.sort(key=lambda item: item[0])
+
+            # Check if we have frames
+            rendered_ok = sum(1 for _, rgb in rendered if rgb is not None)
+            if rendered_ok < num_frames * 0.5:  # At least 50% frames must exist
+                raise RuntimeError(f"Too many frame rendering failures: {rendered_ok}/{num_frames}")
+
+            # Ensure output directory exists
+            Path(output_mp4).parent.mkdir(parents=True, exist_ok=True)
+
+            # Pipe raw RGB frames straight into ffmpeg — no temp PNGs on
+            # disk and no PNG re-decode inside ffmpeg
+            logger.info("[GLB→MP4] Encoding video with ffmpeg...")
+            width, height = resolution
+            blank_frame = b'\xff' * (width * height * 3)  # white fallback
+            video_bytes = b''.join(
+                rgb if rgb is not None else blank_frame for _, rgb in rendered
+            )
+
+            encoder_args = list(_pick_h264_encoder())
+            for attempt_args in (encoder_args, _SOFTWARE_ENCODER_ARGS):
+                proc = subprocess.Popen([
                     'ffmpeg',
                     '-y',  # Overwrite output file
+                    '-f', 'rawvideo',
+                    '-pix_fmt', 'rgb24',
+                    '-s', f'{width}x{height}',
                     '-framerate', str(fps),
-                    '-i', f'{temp_dir}/frame_%04d.png',
-                    '-c:v', 'libx264',
-                    '-pix_fmt', 'yuv420p',
-                    '-crf', '23',  # Quality (lower = better, 23 is good default)
-                    '-preset', 'medium',  # Encoding speed vs compression
+                    '-i', 'pipe:0',
+                    *attempt_args,
                     output_mp4
-                ], capture_output=True, text=True, check=False)
-                
-                if result.returncode != 0:
-                    logger.error(f"[GLB→MP4] FFmpeg error: {result.stderr}")
-                    raise RuntimeError(f"FFmpeg encoding failed: {result.stderr[:200]}")
-                
-                # Verify output file exists and has content
-                if not os.path.exists(output_mp4) or os.path.getsize(output_mp4) == 0:
-                    raise RuntimeError("MP4 file was not created or is empty")
-                
-                file_size_mb = os.path.getsize(output_mp4) / (1024 * 1024)
-                logger.info(f"[GLB→MP4] ✓ Completed: {file_size_mb:.2f}MB → {output_mp4}")
-                
-                return output_mp4
-                
-            finally:
-                # Cleanup temp frames
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-                    logger.debug(f"[GLB→MP4] Cleaned up temp directory")
-        
+                ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                _, stderr = proc.communicate(input=video_bytes)
+
+                if proc.returncode == 0:
+                    break
+                stderr_text = stderr.decode(errors='replace')
+                if attempt_args != _SOFTWARE_ENCODER_ARGS:
+                    # Hardware encoder present but failed at runtime —
+                    # retry once with libx264
+                    logger.warning("[GLB→MP4] Hardware encode failed, retrying with libx264: %s", stderr_text[:200])
+                    continue
+                logger.error("[GLB→MP4] FFmpeg error: %s", stderr_text)
+                raise RuntimeError(f"FFmpeg encoding failed: {stderr_text[:200]}")
+
+            # Verify output file exists and has content
+            if not os.path.exists(output_mp4) or os.path.getsize(output_mp4) == 0:
+                raise RuntimeError("MP4 file was not created or is empty")
+
+            file_size_mb = os.path.getsize(output_mp4) / (1024 * 1024)
+            logger.info("[GLB→MP4] ✓ Completed: %.2fMB → %s", file_size_mb, output_mp4)
+
+            return output_mp4
+
         except Exception as e:
-            logger.error(f"[GLB→MP4] ✗ Conversion failed: {str(e)}")
+            logger.error("[GLB→MP4] ✗ Conversion failed: %s", e)
             raise RuntimeError(f"GLB to MP4 conversion failed: {str(e)}")
     
     # Execute in thread pool
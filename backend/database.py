@@ -1,21 +1,81 @@
 import sqlite3
+import asyncio
+import logging
 import os
+import threading
+from typing import Optional
+
+import aiosqlite
+
+logger = logging.getLogger("listify.database")
 
 DB_PATH = "data/promotia.db"
 SCHEMA_PATH = "data/schema.sql"
 
+# One persistent connection per thread: avoids re-opening the database and
+# re-parsing statements on every request. WAL mode lets readers proceed
+# while a writer commits, and NORMAL sync is safe with WAL.
+_local = threading.local()
+
+
 def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _local.conn = conn
     return conn
 
+
+def close_db_connection():
+    """Close this thread's cached connection (tests / teardown)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+# Single shared async connection for the FastAPI handlers: queries yield
+# to the event loop instead of blocking it, and the connection (with its
+# page cache and prepared statements) lives for the life of the process.
+_async_conn: Optional[aiosqlite.Connection] = None
+
+# aiosqlite serializes statements, not transactions — without this lock
+# a concurrent handler's commit() would land inside another task's open
+# BEGIN and flush its half-written rows. Every write section on the
+# shared connection must hold it from first statement through commit.
+async_write_lock = asyncio.Lock()
+
+
+async def get_async_connection() -> aiosqlite.Connection:
+    global _async_conn
+    if _async_conn is None:
+        _async_conn = await aiosqlite.connect(DB_PATH)
+        _async_conn.row_factory = aiosqlite.Row
+        await _async_conn.execute("PRAGMA journal_mode=WAL")
+        await _async_conn.execute("PRAGMA synchronous=NORMAL")
+        await _async_conn.execute("PRAGMA temp_store=MEMORY")
+    return _async_conn
+
+
+async def close_async_connection():
+    """Close the shared async connection (app shutdown hook)."""
+    global _async_conn
+    if _async_conn is not None:
+        await _async_conn.close()
+        _async_conn = None
+
+
 def init_db():
     if not os.path.exists("data"):
         os.makedirs("data")
-    
+
     with get_db_connection() as conn:
         with open(SCHEMA_PATH, "r") as f:
             schema = f.read()
         conn.executescript(schema)
         conn.commit()
-    print(f"Database initialized at {DB_PATH}")
+    logger.info("Database initialized at %s", DB_PATH)
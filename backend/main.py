@@ -1,9 +1,9 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from typing import List, Dict
+from typing import List, Dict, Literal
 from pathlib import Path
 
 load_dotenv()
@@ -12,26 +12,49 @@ from fastapi.staticfiles import StaticFiles
 # Import auth and database
 from backend.auth import get_current_user
 import backend.user_db as user_db # Assuming user_db module contains db operations
-from backend.database import init_db, get_db_connection
-from backend.vision import detect_labels
-from backend.classifier import classify_product
-
-# Import pipeline steps
-from backend.pipeline_steps import (
-    analyze_image,
-    research_price,
-    generate_content,
-    generate_3d_assets,
-    export_listing
+from backend.database import (
+    init_db,
+    get_async_connection,
+    close_async_connection,
+    async_write_lock,
 )
+from backend.classifier import invalidate_keywords_cache
+from backend.cache import get_cached_pipeline, save_pipeline_to_cache
 
-import shutil
+# backend.pipeline_steps (and backend.vision beneath it) pull in the
+# heavy ML/vision stack; they're imported inside the upload path so
+# workers serving only payments/static routes never pay for them.
+
+import hashlib
+import logging
 import os
-import json
 import uuid
 import asyncio
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+import orjson
+
+logger = logging.getLogger("listify")
+
+# Log records go onto an in-process queue and a background thread drains
+# it, so handlers return immediately instead of doing a locked stdout
+# write on the request path.
+_log_queue = SimpleQueue()
+_log_listener: QueueListener | None = None
+
 
-app = FastAPI(title="Listify Pipeline")
+def _setup_logging():
+    global _log_listener
+    if _log_listener is not None:
+        return
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers = [QueueHandler(_log_queue)]
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+app = FastAPI(title="Listify Pipeline", default_response_class=ORJSONResponse)
 
 # CORS Middleware
 app.add_middleware(
@@ -44,21 +67,81 @@ app.add_middleware(
 
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
-@app.get("/")
-async def read_index():
-    return FileResponse('frontend/index.html')
-
-@app.get("/style.css")
-async def read_css():
-    return FileResponse('frontend/style.css')
-
-@app.get("/script.js")
-async def read_js():
-    return FileResponse('frontend/script.js')
-
 @app.on_event("startup")
 async def startup_event():
+    _setup_logging()
     init_db()
+    # Open the shared async connection up front so the first request
+    # doesn't pay for it
+    await get_async_connection()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_async_connection()
+    if _log_listener is not None:
+        _log_listener.stop()
+
+# SQL kept as module-level constants so the statement strings are built
+# (and interned) once rather than per request
+SQL_INSERT_PRODUCT = "INSERT INTO products (image_path) VALUES (?)"
+SQL_INSERT_HISTORY = (
+    "INSERT INTO history (product_id, niche_id, confidence, labels) "
+    "VALUES (?, ?, ?, ?)"
+)
+SQL_UPDATE_FEEDBACK = (
+    "UPDATE history SET feedback = ?, niche_id = COALESCE(?, niche_id) WHERE id = ?"
+)
+SQL_SELECT_HISTORY_LABELS = "SELECT labels FROM history WHERE id = ?"
+SQL_UPSERT_KEYWORD = (
+    "INSERT INTO keywords (niche_id, keyword, weight) VALUES (?, ?, ?) "
+    "ON CONFLICT(niche_id, keyword) DO NOTHING"
+)
+SQL_INSERT_JOB = "INSERT INTO listing_jobs (id, status) VALUES (?, 'pending')"
+SQL_COMPLETE_JOB = (
+    "UPDATE listing_jobs SET status = 'completed', result = ?, "
+    "updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+)
+SQL_FAIL_JOB = (
+    "UPDATE listing_jobs SET status = 'failed', error = ?, "
+    "updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+)
+SQL_SELECT_JOB = "SELECT status, result, error FROM listing_jobs WHERE id = ?"
+
+# Rejecting junk before the disk write saves a full copy on malformed uploads
+ALLOWED_UPLOAD_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+# The event loop only keeps weak references to tasks; anything spawned
+# to outlive its handler is parked here so it can't be collected
+# mid-flight, and removed once done
+_background_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _save_upload(fileobj, filepath: str) -> str:
+    """Copy an uploaded file to disk with a 1MB readinto loop and return
+    its SHA256 hex digest.
+
+    Hashing happens on the same buffer the write just used — one read
+    pass instead of re-reading the file for the cache key. Runs in a
+    worker thread (asyncio.to_thread) so the disk write never blocks
+    the event loop.
+    """
+    sha256 = hashlib.sha256()
+    buf = bytearray(1 << 20)
+    mv = memoryview(buf)
+    with open(filepath, "wb") as out:
+        while (n := fileobj.readinto(mv)):
+            out.write(mv[:n])
+            sha256.update(mv[:n])
+    return sha256.hexdigest()
+
 
 class FeedbackRequest(BaseModel):
     history_id: int
@@ -69,12 +152,20 @@ class FeedbackRequest(BaseModel):
 async def health_check():
     return {"status": "ok"}
 
+# Niches are effectively static (seeded once, only ever extended), so
+# serve them from memory instead of hitting SQLite on every page load
+_niches_cache: list[dict] | None = None
+
+
 @app.get("/niches")
 async def get_niches():
-    conn = get_db_connection()
-    niches = conn.execute("SELECT * FROM niches").fetchall()
-    conn.close()
-    return [{"id": n["id"], "name": n["name"]} for n in niches]
+    global _niches_cache
+    if _niches_cache is None:
+        conn = await get_async_connection()
+        async with conn.execute("SELECT * FROM niches") as cursor:
+            niches = await cursor.fetchall()
+        _niches_cache = [{"id": n["id"], "name": n["name"]} for n in niches]
+    return _niches_cache
 
 @app.post("/upload")
 async def upload_image(
@@ -82,164 +173,304 @@ async def upload_image(
     current_user: dict = Depends(get_current_user)
 ):
     """Upload endpoint to generate 3D assets and listing copy (requires authentication)"""
-    print("\n" + "="*80)
-    print("LISTIFY PIPELINE STARTED")
-    print("="*80)
-    
+    # Deferred heavy import: free after the first call via sys.modules
+    from backend.pipeline_steps import (
+        analyze_image,
+        research_price,
+        generate_content,
+        generate_3d_assets,
+    )
+
+    logger.info("LISTIFY PIPELINE STARTED")
+
+    assets_task = None
     try:
         user_id = current_user["id"]
         user_email = current_user["email"]
-        
-        # Check if user has credits
-        user_data = user_db.get_user_by_id(user_id)
-        if not user_data or user_data["credits"] < 1:
+
+        # Reject unsupported files before deducting a credit or touching disk
+        ext = os.path.splitext(file.filename or "")[1].lower()
+        if ext not in ALLOWED_UPLOAD_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported file type: {ext or 'none'}. Use JPEG, PNG or WebP."
+            )
+
+        # Check and deduct the credit in one atomic statement — no
+        # SELECT-then-UPDATE race, and a single DB round-trip
+        remaining = await asyncio.to_thread(user_db.db.try_deduct_credit_atomic, user_id)
+        if remaining is None:
             raise HTTPException(
                 status_code=402,
                 detail="Insufficient credits. Please purchase more credits to continue."
             )
         
-        # Deduct credit
-        if not user_db.deduct_credits(user_id, amount=1):
-            raise HTTPException(status_code=402, detail="Failed to deduct credits")
-        
         # Generate unique listing ID
         listing_id = str(uuid.uuid4())
-        
+
         # Save file to disk
-        file_ext = file.filename.split(".")[-1]
-        filename = f"{uuid.uuid4()}.{file_ext}"
+        filename = f"{uuid.uuid4().hex}{ext}"
         filepath = f"data/{filename}"
         
-        with open(filepath, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        print(f"✓ Image uploaded: {filepath}")
-        
+        image_hash = await asyncio.to_thread(_save_upload, file.file, filepath)
+
+        logger.info("✓ Image uploaded: %s", filepath)
+
+        # Re-uploads of an identical image (retries, testing) reuse the
+        # whole previous pipeline run instead of paying for LLM + 3D again
+        pipeline_output = await get_cached_pipeline(image_hash)
+
+        if pipeline_output is not None:
+            logger.info("✓ Pipeline cache hit — skipping analysis and generation")
+            # The cached run already consumed a credit; give this one back
+            await asyncio.to_thread(
+                user_db.db.refund_credits, user_id, amount=1,
+                reason="Duplicate image (cache hit)"
+            )
+            # Everything is already generated, so finish inline
+            result = await _complete_listing(listing_id, user_id, filepath, pipeline_output)
+            result["status"] = "completed"
+            return result
+
+        # STEP 4 only needs the file, so start the slow Trellis call now
+        # and let it overlap the LLM steps below — and keep running after
+        # this handler returns
+        assets_task = _spawn(generate_3d_assets(filepath))
+
         # STEP 1: Analyze Image
         image_analysis = await analyze_image(filepath)
-        
+
         # STEP 2: Research Price
-        price_data = await research_price(image_analysis)
-        
+        price_data = research_price(image_analysis)
+
         # STEP 3: Generate Content (Qwen-Flash LLM)
         content_data = await generate_content(image_analysis, price_data)
-        
-        # STEP 4: Generate 3D Assets (Trellis → GLB + MP4 + USDZ)
-        assets_data = await generate_3d_assets(filepath)
-        
-        # STEP 5: Export Listing
-        pipeline_output = {
-            "image_analysis": image_analysis,
-            "price": price_data,
-            "content": content_data,
-            "assets_3d": assets_data
-        }
-        export_data = await export_listing(pipeline_output)
-        
-        # Save to database (for history/feedback)
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("INSERT INTO products (image_path) VALUES (?)", (filepath,))
-        product_id = cursor.lastrowid
-        
-        cursor.execute(
-            "INSERT INTO history (product_id, niche_id, confidence, labels) VALUES (?, ?, ?, ?)",
-            (product_id, image_analysis["niche"]["id"], image_analysis["confidence"], json.dumps(image_analysis["labels"]))
-        )
-        history_id = cursor.lastrowid
-        
-        conn.commit()
-        conn.close()
-        
-        print("="*80)
-        print("LISTIFY PIPELINE COMPLETED SUCCESSFULLY")
-        print("="*80 + "\n")
-        
-        # Return complete pipeline result
-        # Get results
-        result = {
-            "listing_id": listing_id,
-            "export_formats": export_data, # Assuming export_data is the export_result
-            "files": {
-                "json": None, # Placeholder, as export_listing doesn't return a path directly
-                "glb_3d_model": assets_data.get("glb_path"),
-                "mp4_video": assets_data.get("mp4_path"),
-                "usdz_ar_model": assets_data.get("usdz_path"),
-                "preview_renders": assets_data.get("preview_renders", []),
-                "processed_image": filepath # Using the original uploaded filepath
+
+        # STEP 4+5 (3D assets + export) take tens of seconds; finish them
+        # in the background and let the frontend poll the job status
+        # instead of holding this connection open
+        conn = await get_async_connection()
+        async with async_write_lock:
+            await conn.execute(SQL_INSERT_JOB, (listing_id,))
+            await conn.commit()
+
+        _spawn(_finish_pipeline(
+            listing_id, user_id, image_hash, filepath,
+            image_analysis, price_data, content_data, assets_task
+        ))
+
+        return ORJSONResponse(
+            status_code=202,
+            content={
+                "listing_id": listing_id,
+                "status": "processing",
+                "status_url": f"/listings/{listing_id}/status",
+                "image_analysis": image_analysis,
+                "price": price_data,
+                "content": content_data,
             }
-        }
-        
-        # Save listing to database
-        try:
-            amazon_format = export_data.get("amazon", {})
-            user_db.db.save_listing(
-                user_id=user_id,
-                image_url=str(result["files"]["processed_image"]),
-                title=amazon_format.get("product_name", "Generated Product"),
-                description=amazon_format.get("description", ""),
-                glb_url=str(result["files"]["glb_3d_model"]) if result["files"]["glb_3d_model"] else None,
-                mp4_url=str(result["files"]["mp4_video"]) if result["files"]["mp4_video"] else None,
-                usdz_url=str(result["files"]["usdz_ar_model"]) if result["files"]["usdz_ar_model"] else None,
-                price=str(amazon_format.get("price", "")),
-                keywords=json.dumps(amazon_format.get("keywords", [])),
-            )
-        except Exception as db_error:
-            print(f"Warning: Failed to save listing to database: {db_error}")
-        
-        return JSONResponse(content=result)
-        
+        )
+
     except HTTPException:
         # Re-raise HTTP exceptions (auth errors, insufficient credits)
         raise
     except Exception as e:
+        # A still-running Trellis task would keep billing after the user
+        # is refunded; stop it and retrieve its outcome
+        if assets_task is not None and not assets_task.done():
+            assets_task.cancel()
+        if assets_task is not None:
+            try:
+                await assets_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
         # Refund credit on error
         try:
-            user_db.refund_credits(user_id, amount=1, reason=f"Generation failed: {str(e)}")
-        except:
+            await asyncio.to_thread(
+                user_db.db.refund_credits, user_id, amount=1,
+                reason=f"Generation failed: {str(e)}"
+            )
+        except Exception:
             pass
-        
-        print(f"Error processing upload: {str(e)}")
-        import traceback
-        traceback.print_exc()
+
+        logger.exception("Error processing upload: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to process image: {str(e)}")
 
+
+async def _complete_listing(listing_id: str, user_id: str, filepath: str, pipeline_output: dict) -> dict:
+    """Export the listing and persist product/history/listing rows.
+
+    Shared tail of the pipeline, used inline on cache hits and from the
+    background task on fresh runs.
+    """
+    from backend.pipeline_steps import export_listing
+
+    image_analysis = pipeline_output["image_analysis"]
+    assets_data = pipeline_output["assets_3d"]
+
+    # STEP 5: Export Listing
+    export_data = await export_listing(pipeline_output)
+
+    # Save to database (for history/feedback) — both rows in one
+    # explicit transaction, serialized by async_write_lock: aiosqlite
+    # interleaves statements from concurrent tasks, so the lock is what
+    # actually keeps this pair atomic against other handlers' commits
+    conn = await get_async_connection()
+
+    async with async_write_lock:
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = await conn.execute(SQL_INSERT_PRODUCT, (filepath,))
+            product_id = cursor.lastrowid
+
+            cursor = await conn.execute(
+                SQL_INSERT_HISTORY,
+                (product_id, image_analysis["niche"]["id"], image_analysis["confidence"], orjson.dumps(image_analysis["labels"]).decode())
+            )
+            history_id = cursor.lastrowid
+
+            await conn.commit()
+        except BaseException:
+            await conn.rollback()
+            raise
+
+    result = {
+        "listing_id": listing_id,
+        "export_formats": export_data, # Assuming export_data is the export_result
+        "files": {
+            "json": None, # Placeholder, as export_listing doesn't return a path directly
+            "glb_3d_model": assets_data.get("glb_path"),
+            "mp4_video": assets_data.get("mp4_path"),
+            "usdz_ar_model": assets_data.get("usdz_path"),
+            "preview_renders": assets_data.get("preview_renders", []),
+            "processed_image": filepath # Using the original uploaded filepath
+        }
+    }
+
+    # Save listing to database
+    try:
+        amazon_format = export_data.get("amazon", {})
+        await asyncio.to_thread(
+            user_db.db.save_listing,
+            user_id=user_id,
+            image_url=str(result["files"]["processed_image"]),
+            title=amazon_format.get("product_name", "Generated Product"),
+            description=amazon_format.get("description", ""),
+            glb_url=str(result["files"]["glb_3d_model"]) if result["files"]["glb_3d_model"] else None,
+            mp4_url=str(result["files"]["mp4_video"]) if result["files"]["mp4_video"] else None,
+            usdz_url=str(result["files"]["usdz_ar_model"]) if result["files"]["usdz_ar_model"] else None,
+            price=str(amazon_format.get("price", "")),
+            keywords=orjson.dumps(amazon_format.get("keywords", [])).decode(),
+        )
+    except Exception as db_error:
+        logger.warning("Failed to save listing to database: %s", db_error)
+
+    return result
+
+
+async def _finish_pipeline(
+    listing_id: str,
+    user_id: str,
+    image_hash: str,
+    filepath: str,
+    image_analysis: dict,
+    price_data: dict,
+    content_data: dict,
+    assets_task: "asyncio.Task"
+) -> None:
+    """Background continuation of /upload: wait for 3D generation, export
+    the listing, and record the job outcome for status polling."""
+    conn = await get_async_connection()
+    try:
+        assets_data = await assets_task
+
+        pipeline_output = {
+            "image_analysis": image_analysis,
+            "price": price_data,
+            "content": content_data,
+            "assets_3d": assets_data
+        }
+        _spawn(save_pipeline_to_cache(image_hash, pipeline_output))
+
+        result = await _complete_listing(listing_id, user_id, filepath, pipeline_output)
+
+        async with async_write_lock:
+            await conn.execute(SQL_COMPLETE_JOB, (orjson.dumps(result).decode(), listing_id))
+            await conn.commit()
+        logger.info("LISTIFY PIPELINE COMPLETED SUCCESSFULLY")
+
+    except Exception as e:
+        logger.exception("Background pipeline failed for listing %s: %s", listing_id, e)
+        try:
+            await asyncio.to_thread(
+                user_db.db.refund_credits, user_id, amount=1,
+                reason=f"Generation failed: {str(e)}"
+            )
+        except Exception:
+            pass
+        async with async_write_lock:
+            await conn.execute(SQL_FAIL_JOB, (str(e), listing_id))
+            await conn.commit()
+
+
+@app.get("/listings/{listing_id}/status")
+async def get_listing_status(listing_id: str):
+    """Poll the status of a background listing job."""
+    conn = await get_async_connection()
+    async with conn.execute(SQL_SELECT_JOB, (listing_id,)) as cursor:
+        row = await cursor.fetchone()
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="Unknown listing_id")
+
+    response = {"listing_id": listing_id, "status": row["status"]}
+    if row["status"] == "completed" and row["result"]:
+        response["result"] = orjson.loads(row["result"])
+    elif row["status"] == "failed":
+        response["error"] = row["error"]
+    return response
+
 @app.post("/feedback")
 async def submit_feedback(feedback: FeedbackRequest):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "UPDATE history SET feedback = ?, niche_id = COALESCE(?, niche_id) WHERE id = ?",
-        (feedback.feedback, feedback.corrected_niche_id, feedback.history_id)
-    )
-    
-    # Learning Logic
-    if feedback.corrected_niche_id:
-        # Get labels from history
-        row = cursor.execute("SELECT labels FROM history WHERE id = ?", (feedback.history_id,)).fetchone()
-        if row and row["labels"]:
-            labels = json.loads(row["labels"])
-            
-            # Add labels to keywords table for the corrected niche
-            for label in labels:
-                # Check if keyword already exists for this niche to avoid duplicates (optional but good)
-                exists = cursor.execute(
-                    "SELECT 1 FROM keywords WHERE niche_id = ? AND keyword = ?", 
-                    (feedback.corrected_niche_id, label)
-                ).fetchone()
-                
-                if not exists:
-                    cursor.execute(
-                        "INSERT INTO keywords (niche_id, keyword, weight) VALUES (?, ?, ?)", 
-                        (feedback.corrected_niche_id, label, 2.0) # Give learned keywords higher weight
-                    )
-                    print(f"LEARNED: Added '{label}' to niche {feedback.corrected_niche_id}")
-
-    conn.commit()
-    conn.close()
-    
+    conn = await get_async_connection()
+    learned = False
+
+    async with async_write_lock:
+        await conn.execute(
+            SQL_UPDATE_FEEDBACK,
+            (feedback.feedback, feedback.corrected_niche_id, feedback.history_id)
+        )
+
+        # Learning Logic
+        if feedback.corrected_niche_id:
+            # Get labels from history
+            async with conn.execute(
+                SQL_SELECT_HISTORY_LABELS, (feedback.history_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row and row["labels"]:
+                labels = orjson.loads(row["labels"])
+
+                # Add labels to keywords table for the corrected niche in one
+                # batch; the unique index dedupes instead of a SELECT per label
+                await conn.executemany(
+                    SQL_UPSERT_KEYWORD,
+                    [(feedback.corrected_niche_id, label, 2.0) for label in labels] # Learned keywords get higher weight
+                )
+                logger.info("LEARNED: Added %d labels to niche %d", len(labels), feedback.corrected_niche_id)
+                learned = True
+
+        await conn.commit()
+
+        # New keywords change classification results. Invalidate only
+        # after the commit: doing it earlier lets a concurrent
+        # classify_product reload the snapshot from the uncommitted
+        # database and memoize it under the already-bumped version,
+        # hiding the learned keywords until the next feedback bump
+        if learned:
+            invalidate_keywords_cache()
+
     return {"status": "feedback recorded and learning updated"}
 
 
@@ -251,19 +482,21 @@ from backend.payments import (
     create_checkout_session,
     verify_webhook_signature,
     process_successful_payment,
-    get_all_packages
+    PACKAGES_JSON_BYTES
 )
-from fastapi import Header, Request
+from fastapi import Header, Request, Response
 
 
 class CreateCheckoutRequest(BaseModel):
-    package_id: str
+    # Literal validation happens in pydantic-core (Rust) and rejects bad
+    # payloads with a 422 before the handler runs
+    package_id: Literal["starter", "creator", "business", "enterprise"]
 
 
 @app.get("/payments/packages")
 async def get_credit_packages():
-    """Get all available credit packages."""
-    return get_all_packages()
+    """Get all available credit packages (pre-rendered JSON, zero serialization)."""
+    return Response(content=PACKAGES_JSON_BYTES, media_type="application/json")
 
 
 @app.post("/payments/create-checkout-session")
@@ -279,8 +512,10 @@ async def create_stripe_checkout(
         user_id = current_user["id"]
         user_email = current_user["email"]
         
-        # Create Stripe Checkout session
-        session_data = create_checkout_session(
+        # Create Stripe Checkout session — the SDK call is a blocking
+        # HTTPS round-trip, so run it off the event loop
+        session_data = await asyncio.to_thread(
+            create_checkout_session,
             package_id=request.package_id,
             user_id=user_id,
             user_email=user_email
@@ -329,14 +564,20 @@ async def stripe_webhook(
             )
             
             if success:
-                print(f"✓ Credits added: {payment_info['credits']} credits to user {payment_info['user_id']}")
+                logger.info("✓ Credits added: %d credits to user %s", payment_info['credits'], payment_info['user_id'])
             else:
-                print(f"⚠ Payment already processed: {payment_info['stripe_session_id']}")
+                logger.warning("⚠ Payment already processed: %s", payment_info['stripe_session_id'])
         
         return {"status": "success"}
     
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Webhook error: {str(e)}")
+        logger.error("Webhook error: %s", e)
         raise HTTPException(status_code=500, detail="Webhook processing failed")
+
+
+# Registered last so API routes above take precedence. StaticFiles serves
+# index.html for "/" (html=True), handles conditional requests with 304s,
+# and uses sendfile for zero-copy transfers.
+app.mount("/", StaticFiles(directory="frontend", html=True), name="root")
@@ -4,6 +4,7 @@ Stripe payment processing for Listify credit purchases.
 import os
 from typing import Dict, Optional
 from datetime import datetime
+import orjson
 import stripe
 from dotenv import load_dotenv
 
@@ -55,9 +56,7 @@ def create_checkout_session(package_id: str, user_id: str, user_email: str) -> D
     Returns:
         Dictionary with checkout session URL and session ID
     """
-    if package_id not in CREDIT_PACKAGES:
-        raise ValueError(f"Invalid package_id: {package_id}")
-    
+    # package_id is validated upstream by the request model (Literal)
     package = CREDIT_PACKAGES[package_id]
     
     try:
@@ -147,3 +146,9 @@ def get_package_info(package_id: str) -> Optional[Dict]:
 def get_all_packages() -> Dict:
     """Get all available credit packages."""
     return CREDIT_PACKAGES
+
+
+# Packages are immutable at module load — render the JSON body once so
+# the /payments/packages endpoint can return it without per-request
+# serialization
+PACKAGES_JSON_BYTES = orjson.dumps(CREDIT_PACKAGES)
@@ -3,27 +3,104 @@ Listify Pipeline Steps
 Orchestrates AI/ML services to transform product images into marketplace listings
 """
 import os
-import json
+import logging
+import re
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Any
 from io import BytesIO
-import base64
 
 # AI/ML imports
-from openai import OpenAI
+import aiofiles
+import httpx
+import orjson
+from openai import AsyncOpenAI
 import replicate
-from rembg import remove
+from rembg import new_session, remove
 from PIL import Image
 import requests
 
 # Local imports
-from backend.vision import detect_labels
+from backend.vision import detect_labels_async
 from backend.classifier import classify_product
+from backend.cache import content_cache_key, get_cached_content, save_content_to_cache
 
 # Environment variables
 DASHSCOPE_API_KEY = os.getenv("DASHSCOPE_API_KEY")
 REPLICATE_API_TOKEN = os.getenv("REPLICATE_API_TOKEN")
 
+# Handlers come from main's queue-based setup, so emitting a record
+# never blocks on stdout under concurrent listings
+logger = logging.getLogger("listify.pipeline")
+
+# Create once at import instead of a syscall per export
+os.makedirs("data/exports", exist_ok=True)
+
+# One client for the process: the underlying httpx pool keeps DashScope
+# connections alive across listings instead of re-handshaking per call
+_llm_client = None
+
+
+def _get_llm_client() -> AsyncOpenAI:
+    global _llm_client
+    if _llm_client is None:
+        # HTTP/2 multiplexes concurrent completions over one TLS
+        # connection instead of opening a socket per in-flight call
+        _llm_client = AsyncOpenAI(
+            api_key=DASHSCOPE_API_KEY,
+            base_url="https://dashscope-intl.aliyuncs.com/compatible-mode/v1",
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+                timeout=60
+            )
+        )
+    return _llm_client
+
+
+# Bounds concurrent LLM calls so a burst of uploads doesn't trip
+# DashScope rate limits or queue unbounded work
+_LLM_SEMAPHORE = asyncio.Semaphore(8)
+
+# Pull a JSON object (or array, for batched calls) out of possibly-
+# markdown-fenced LLM output. The fenced pattern is tried first and the
+# bare brace scan only runs when no fence matched — in one combined
+# alternation a stray brace in prose before the fence would win the
+# leftmost-match race and capture a non-JSON span
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_BARE = re.compile(r"(\{.*\})", re.DOTALL)
+_JSON_ARRAY_FENCE = re.compile(r"```(?:json)?\s*(\[.*?\])\s*```", re.DOTALL)
+_JSON_ARRAY_BARE = re.compile(r"(\[.*\])", re.DOTALL)
+
+# CPU-heavy work (rembg ONNX inference, PIL compositing) runs here so it
+# never stalls the event loop for other in-flight listings
+_CPU_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# One ONNX session for the process, built at import so no request pays
+# the InferenceSession construction. Keeps rembg's default u2net model
+# so output quality is unchanged.
+_REMBG_SESSION = new_session("u2net")
+
+_replicate_client = None
+
+
+def _get_replicate_client() -> "replicate.Client":
+    global _replicate_client
+    if _replicate_client is None:
+        _replicate_client = replicate.Client(api_token=REPLICATE_API_TOKEN)
+    return _replicate_client
+
+
+def _composite_on_white(png_bytes: bytes) -> bytes:
+    """Paste an RGBA cutout onto a white background, return PNG bytes."""
+    img = Image.open(BytesIO(png_bytes)).convert("RGBA")
+    white_bg = Image.new("RGB", img.size, (255, 255, 255))
+    white_bg.paste(img, mask=img.split()[3])  # Use alpha channel as mask
+    buf = BytesIO()
+    white_bg.save(buf, "PNG")
+    return buf.getvalue()
+
 
 async def analyze_image(image_path: str) -> Dict[str, Any]:
     """
@@ -42,10 +119,10 @@ async def analyze_image(image_path: str) -> Dict[str, Any]:
         }
     """
     try:
-        print(f"[Pipeline Step 1] Analyzing image: {image_path}")
+        logger.info("[Pipeline Step 1] Analyzing image: %s", image_path)
         
         # Detect labels using Google Cloud Vision
-        labels = detect_labels(image_path)
+        labels = await detect_labels_async(image_path)
         
         # Classify product niche
         classification = classify_product(labels)
@@ -68,18 +145,41 @@ async def analyze_image(image_path: str) -> Dict[str, Any]:
             "confidence": classification.get("confidence", 0.0)
         }
         
-        print(f"[Pipeline Step 1] ✓ Analysis complete: {classification.get('niche_name')}")
+        logger.info("[Pipeline Step 1] ✓ Analysis complete: %s", classification.get("niche_name"))
         return result
         
     except Exception as e:
-        print(f"[Pipeline Step 1] ✗ Error: {str(e)}")
+        logger.error("[Pipeline Step 1] ✗ Error: %s", e)
         raise
 
 
-async def research_price(image_analysis: Dict[str, Any]) -> Dict[str, Any]:
+# Heuristic price ranges by category (in USD); read-only so the table is
+# built once at import instead of per call
+PRICE_RANGES = MappingProxyType({
+    "Fitness & Wellness": (15, 150),
+    "Pet Supplies": (10, 80),
+    "Home Office": (30, 300),
+    "Beauty & Personal Care": (10, 100),
+    "Tech Accessories": (15, 120),
+    "Outdoor & Adventure": (25, 200),
+    "Kitchen & Dining": (20, 150),
+    "Fashion & Apparel": (20, 200),
+    "Gaming": (30, 400),
+    "Home Decor": (25, 250),
+    "Baby & Kids": (15, 120),
+    "Automotive": (20, 180),
+    "Gardening": (15, 100),
+    "Books & Media": (10, 50),
+    "Art & Crafts": (10, 80),
+})
+
+
+def research_price(image_analysis: Dict[str, Any]) -> Dict[str, Any]:
     """
     Step 2: Research market price based on product attributes
     Uses heuristic pricing based on category
+
+    Plain function — it's just a table lookup, so there's nothing to await.
     
     Args:
         image_analysis: Output from analyze_image()
@@ -93,31 +193,12 @@ async def research_price(image_analysis: Dict[str, Any]) -> Dict[str, Any]:
         }
     """
     try:
-        print(f"[Pipeline Step 2] Researching price...")
+        logger.info("[Pipeline Step 2] Researching price...")
         
         niche_name = image_analysis["niche"]["name"]
         
-        # Heuristic price ranges by category (in USD)
-        price_ranges = {
-            "Fitness & Wellness": (15, 150),
-            "Pet Supplies": (10, 80),
-            "Home Office": (30, 300),
-            "Beauty & Personal Care": (10, 100),
-            "Tech Accessories": (15, 120),
-            "Outdoor & Adventure": (25, 200),
-            "Kitchen & Dining": (20, 150),
-            "Fashion & Apparel": (20, 200),
-            "Gaming": (30, 400),
-            "Home Decor": (25, 250),
-            "Baby & Kids": (15, 120),
-            "Automotive": (20, 180),
-            "Gardening": (15, 100),
-            "Books & Media": (10, 50),
-            "Art & Crafts": (10, 80),
-        }
-        
         # Get price range for niche, or use default
-        min_price, max_price = price_ranges.get(niche_name, (20, 100))
+        min_price, max_price = PRICE_RANGES.get(niche_name, (20, 100))
         estimated_price = (min_price + max_price) / 2
         
         result = {
@@ -130,11 +211,11 @@ async def research_price(image_analysis: Dict[str, Any]) -> Dict[str, Any]:
             "confidence": "medium"
         }
         
-        print(f"[Pipeline Step 2] ✓ Price estimated: ${estimated_price:.2f}")
+        logger.info("[Pipeline Step 2] ✓ Price estimated: $%.2f", estimated_price)
         return result
         
     except Exception as e:
-        print(f"[Pipeline Step 2] ✗ Error: {str(e)}")
+        logger.error("[Pipeline Step 2] ✗ Error: %s", e)
         raise
 
 
@@ -155,21 +236,25 @@ async def generate_content(product_attributes: Dict[str, Any], price_data: Dict[
         }
     """
     try:
-        print(f"[Pipeline Step 3] Generating content with Qwen-Flash LLM...")
+        logger.info("[Pipeline Step 3] Generating content with Qwen-Flash LLM...")
         
         if not DASHSCOPE_API_KEY or DASHSCOPE_API_KEY == "your_dashscope_api_key_here":
             raise ValueError("DASHSCOPE_API_KEY not configured in .env file")
         
-        # Initialize OpenAI client with DashScope endpoint
-        client = OpenAI(
-            api_key=DASHSCOPE_API_KEY,
-            base_url="https://dashscope-intl.aliyuncs.com/compatible-mode/v1"
-        )
+        client = _get_llm_client()
         
         # Prepare product information for prompt
         niche = product_attributes["niche"]["name"]
         labels = ", ".join(product_attributes["labels"][:8])
         price = price_data["estimated_price"]
+
+        # Same niche + labels + price band means the same copy works —
+        # return cached content instead of re-prompting the LLM
+        cache_key = content_cache_key(niche, product_attributes["labels"], price)
+        cached = await get_cached_content(cache_key)
+        if cached is not None:
+            logger.info("[Pipeline Step 3] ✓ Content cache hit")
+            return cached
         
         # Construct prompt
         system_prompt = """You are an expert marketplace SEO specialist. Generate compelling, SEO-optimized product listings that drive conversions.
@@ -193,36 +278,31 @@ Please provide:
 
 Format your response as JSON with keys: title, description, bullet_points, tags"""
 
-        # Call Qwen-Flash API
-        response = client.chat.completions.create(
-            model="qwen-flash",  # Free, fast model
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1000
-        )
+        # Call Qwen-Flash API — awaited, so the event loop keeps serving
+        # other requests during the LLM round-trip
+        async with _LLM_SEMAPHORE:
+            response = await client.chat.completions.create(
+                model="qwen-flash",  # Free, fast model
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.7,
+                max_tokens=1000
+            )
         
         # Parse response
         generated_text = response.choices[0].message.content
         
-        # Try to extract JSON from response
+        # Try to extract JSON from response (may be wrapped in markdown
+        # code blocks)
         try:
-            # Find JSON in response (may be wrapped in markdown code blocks)
-            if "```json" in generated_text:
-                json_start = generated_text.find("```json") + 7
-                json_end = generated_text.find("```", json_start)
-                json_text = generated_text[json_start:json_end].strip()
-            elif "```" in generated_text:
-                json_start = generated_text.find("```") + 3
-                json_end = generated_text.find("```", json_start)
-                json_text = generated_text[json_start:json_end].strip()
-            else:
-                json_text = generated_text
+            m = _JSON_FENCE.search(generated_text) or _JSON_BARE.search(generated_text)
+            json_text = m.group(1) if m else generated_text
             
-            result = json.loads(json_text)
-        except json.JSONDecodeError:
+            result = orjson.loads(json_text)
+            await save_content_to_cache(cache_key, result)
+        except orjson.JSONDecodeError:
             # Fallback if LLM doesn't return valid JSON
             result = {
                 "title": f"Premium {niche} Product - High Quality",
@@ -237,11 +317,11 @@ Format your response as JSON with keys: title, description, bullet_points, tags"
                 "tags": product_attributes["labels"][:8]
             }
         
-        print(f"[Pipeline Step 3] ✓ Content generated: {result['title'][:50]}...")
+        logger.info("[Pipeline Step 3] ✓ Content generated: %.50s...", result["title"])
         return result
         
     except Exception as e:
-        print(f"[Pipeline Step 3] ✗ Error: {str(e)}")
+        logger.error("[Pipeline Step 3] ✗ Error: %s", e)
         # Return fallback content on error
         return {
             "title": f"{product_attributes['niche']['name']} Product",
@@ -252,6 +332,107 @@ Format your response as JSON with keys: title, description, bullet_points, tags"
         }
 
 
+async def generate_content_batch(
+    items: list,
+    batched: bool = True
+) -> list:
+    """
+    Generate listing content for several products at once.
+
+    With batched=True, up to _CONTENT_BATCH_SIZE products go into a
+    single Qwen-Flash call returning a JSON array — one HTTP round-trip
+    and one prompt preamble amortized over the batch. Falls back to
+    concurrent individual calls if the batched output can't be parsed
+    (or when batched=False).
+
+    Args:
+        items: List of (product_attributes, price_data) pairs, as passed
+            to generate_content
+
+    Returns:
+        list: One content dict per item, in input order
+    """
+    if not items:
+        return []
+    if not batched or len(items) == 1:
+        return list(await asyncio.gather(
+            *(generate_content(attrs, price) for attrs, price in items)
+        ))
+
+    results = []
+    for start in range(0, len(items), _CONTENT_BATCH_SIZE):
+        batch = items[start:start + _CONTENT_BATCH_SIZE]
+        results.extend(await _generate_content_batch_call(batch))
+    return results
+
+
+_CONTENT_BATCH_SIZE = 8
+
+
+async def _generate_content_batch_call(batch: list) -> list:
+    """One batched LLM call; falls back to individual calls on failure."""
+    try:
+        if not DASHSCOPE_API_KEY or DASHSCOPE_API_KEY == "your_dashscope_api_key_here":
+            raise ValueError("DASHSCOPE_API_KEY not configured in .env file")
+
+        client = _get_llm_client()
+
+        product_lines = []
+        for i, (attrs, price_data) in enumerate(batch, 1):
+            niche = attrs["niche"]["name"]
+            labels = ", ".join(attrs["labels"][:8])
+            price = price_data["estimated_price"]
+            product_lines.append(
+                f"{i}. Category: {niche}; Features: {labels}; Price: ${price} USD"
+            )
+
+        system_prompt = """You are an expert marketplace SEO specialist. Generate compelling, SEO-optimized product listings that drive conversions.
+Your listings should be:
+- Engaging and benefit-focused
+- Keyword-rich for search optimization
+- Professional yet persuasive
+- Formatted for marketplace platforms (eBay, Amazon, Mercado Livre)"""
+
+        user_prompt = f"""Generate complete product listings for the following {len(batch)} products:
+
+{chr(10).join(product_lines)}
+
+For each product provide:
+1. A catchy, SEO-optimized product title (60-80 characters)
+2. A compelling product description (150-200 words)
+3. 5 bullet points highlighting key features and benefits
+4. 8-10 relevant search tags/keywords
+
+Return a JSON array of {len(batch)} objects, each with keys: title, description, bullet_points, tags. Keep the array in the same order as the products above."""
+
+        async with _LLM_SEMAPHORE:
+            response = await client.chat.completions.create(
+                model="qwen-flash",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.7,
+                max_tokens=1000 * len(batch)
+            )
+
+        generated_text = response.choices[0].message.content
+
+        m = _JSON_ARRAY_FENCE.search(generated_text) or _JSON_ARRAY_BARE.search(generated_text)
+        json_text = m.group(1) if m else generated_text
+
+        parsed = orjson.loads(json_text)
+        if not isinstance(parsed, list) or len(parsed) != len(batch):
+            raise ValueError(f"Expected {len(batch)} listings, got {parsed!r:.80}")
+        return parsed
+
+    except Exception as e:
+        logger.warning("[Pipeline Step 3] ⚠ Batched generation failed (%s), falling back to individual calls", e)
+        return list(await asyncio.gather(
+            *(generate_content(attrs, price) for attrs, price in batch)
+        ))
+
+
 async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
     """
     Step 4: Generate multi-format 3D assets from product image
@@ -281,37 +462,52 @@ async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
     import time
     import uuid
     from tenacity import retry, stop_after_attempt, wait_exponential
+    from backend.cache import get_cached_result, save_to_cache
     from backend.converters import download_file_streaming, glb_to_mp4_simple
     from backend.converters.glb_to_usdz import glb_to_usdz_simple
-    
+
     start_time = time.time()
-    
+
+    # Identical images (by content hash) reuse the previous Trellis run
+    cached = await get_cached_result(image_path)
+    if cached is not None:
+        logger.info("[Pipeline Step 4] ✓ Cache hit, reusing 3D assets")
+        return cached
+
     try:
-        print(f"[Pipeline Step 4] Generating 3D assets with Trellis...")
+        logger.info("[Pipeline Step 4] Generating 3D assets with Trellis...")
         
         # [STEP 1] Pre-processing: Remove background
-        print(f"[Pipeline Step 4] Pre-processing: Removing background...")
+        logger.info("[Pipeline Step 4] Pre-processing: Removing background...")
+        loop = asyncio.get_event_loop()
         with open(image_path, 'rb') as f:
             input_image = f.read()
         
-        # Remove background using rembg
-        output_image = remove(input_image)
+        # Remove background using rembg — seconds of ONNX inference, so
+        # run it in the CPU pool like the Trellis call below, against the
+        # session built once at import
+        output_image = await loop.run_in_executor(
+            _CPU_POOL, lambda: remove(input_image, session=_REMBG_SESSION)
+        )
         
-        # Convert to PIL Image and add white background
-        img = Image.open(BytesIO(output_image)).convert("RGBA")
+        # Composite onto white in memory — the PNG bytes feed the upload
+        # directly, with no intermediate write-then-reread round-trip
+        preprocessed_png = await loop.run_in_executor(_CPU_POOL, _composite_on_white, output_image)
+        preprocessed_path = image_path.replace(".jpg", "_processed.png").replace(".jpeg", "_processed.png")
         
-        # Create white background
-        white_bg = Image.new("RGB", img.size, (255, 255, 255))
-        white_bg.paste(img, mask=img.split()[3])  # Use alpha channel as mask
+        # The response references preprocessed_path, so persist it — but
+        # concurrently with the Trellis work, not in front of it
+        def write_preprocessed():
+            with open(preprocessed_path, 'wb') as f:
+                f.write(preprocessed_png)
         
-        # Save preprocessed image
-        preprocessed_path = image_path.replace(".jpg", "_processed.png").replace(".jpeg", "_processed.png")
-        white_bg.save(preprocessed_path, "PNG")
-        print(f"[Pipeline Step 4] ✓ Background removed: {preprocessed_path}")
+        preprocessed_write = loop.run_in_executor(None, write_preprocessed)
+        logger.info("[Pipeline Step 4] ✓ Background removed: %s", preprocessed_path)
         
         # [STEP 2] Check if Replicate token is configured
         if not REPLICATE_API_TOKEN or REPLICATE_API_TOKEN == "your_replicate_api_token_here":
-            print(f"[Pipeline Step 4] ⚠ REPLICATE_API_TOKEN not configured")
+            logger.warning("[Pipeline Step 4] ⚠ REPLICATE_API_TOKEN not configured")
+            await preprocessed_write
             return {
                 "glb_path": None,
                 "mp4_path": None,
@@ -325,22 +521,28 @@ async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
             }
         
         # [STEP 3] Call Trellis API with retry logic
-        print(f"[Pipeline Step 4] Calling Trellis API...")
+        logger.info("[Pipeline Step 4] Calling Trellis API...")
         
-        # Read preprocessed image and convert to base64
-        with open(preprocessed_path, 'rb') as f:
-            image_data = f.read()
-            image_b64 = base64.b64encode(image_data).decode()
+        client = _get_replicate_client()
+        
+        # Upload the PNG to Replicate's file store and pass its URL —
+        # skips the 33% base64 inflation and the giant JSON request body
+        file_obj = await loop.run_in_executor(
+            None, client.files.create, BytesIO(preprocessed_png)
+        )
+        image_url = file_obj.urls["get"]
         
         @retry(
             stop=stop_after_attempt(3),
             wait=wait_exponential(multiplier=1, min=2, max=10)
         )
-        def call_trellis_with_retry():
-            return replicate.run(
+        async def call_trellis_with_retry():
+            # async_run waits on the prediction with asyncio sleeps, so
+            # the 30-90s generation doesn't park an executor thread
+            return await client.async_run(
                 "firtoz/trellis:e8f6c45206993f297372f5436b90350817bd9b4a0d52d2a76df50c1c8afa2b3c",
                 input={
-                    "image": f"data:image/png;base64,{image_b64}",
+                    "image": image_url,
                     "seed": 0,
                     "texture_size": 1024,
                     "mesh_simplify": 0.95,
@@ -354,11 +556,10 @@ async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
                 }
             )
         
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        trellis_output = await loop.run_in_executor(None, call_trellis_with_retry)
+        trellis_output = await call_trellis_with_retry()
         
-        print(f"[Pipeline Step 4] ✓ Trellis API complete")
+        logger.info("[Pipeline Step 4] ✓ Trellis API complete")
+        await preprocessed_write  # surface any disk error before we report the path
         
         # [STEP 4] Parse Trellis output
         glb_url = None
@@ -377,25 +578,32 @@ async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
             raise ValueError("Trellis did not return a valid GLB model URL")
         
         # [STEP 5] Download GLB (async streaming)
-        print(f"[Pipeline Step 4] Downloading GLB model...")
+        logger.info("[Pipeline Step 4] Downloading GLB model...")
         glb_filename = f"{uuid.uuid4().hex[:8]}.glb"
         glb_path = f"data/models/{glb_filename}"
         
         glb_path = await download_file_streaming(glb_url, glb_path)
         
         # [STEP 6] Parallel conversions: GLB → MP4 + GLB → USDZ
-        print(f"[Pipeline Step 4] Converting to multiple formats...")
+        logger.info("[Pipeline Step 4] Converting to multiple formats...")
         
         mp4_path = glb_path.replace(".glb", ".mp4")
         usdz_path = glb_path.replace(".glb", ".usdz")
         
-        # Run conversions in parallel with graceful degradation
+        # Run conversions in parallel with graceful degradation; preview
+        # renders download in the same gather, riding along with the
+        # CPU-bound conversions for free
         mp4_task = glb_to_mp4_simple(glb_path, mp4_path)
         usdz_task = glb_to_usdz_simple(glb_path, usdz_path)
+        preview_tasks = [
+            download_file_streaming(url, f"data/renders/{uuid.uuid4().hex[:8]}.png")
+            for url in preview_urls
+        ]
         
         conversion_results = await asyncio.gather(
             mp4_task,
             usdz_task,
+            *preview_tasks,
             return_exceptions=True  # Don't fail if one conversion fails
         )
         
@@ -403,26 +611,32 @@ async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
         mp4_result = conversion_results[0]
         usdz_result = conversion_results[1]
         
+        # Keep the remote URL for any preview that failed to download
+        preview_renders = [
+            local if not isinstance(local, Exception) else url
+            for url, local in zip(preview_urls, conversion_results[2:])
+        ]
+        
         # Check which conversions succeeded
         formats_generated = ["glb"]
         
         if not isinstance(mp4_result, Exception):
             mp4_path = mp4_result
             formats_generated.append("mp4")
-            print(f"[Pipeline Step 4] ✓ MP4 generated: {mp4_path}")
+            logger.info("[Pipeline Step 4] ✓ MP4 generated: %s", mp4_path)
         else:
-            print(f"[Pipeline Step 4] ⚠ MP4 conversion failed: {mp4_result}")
+            logger.warning("[Pipeline Step 4] ⚠ MP4 conversion failed: %s", mp4_result)
             mp4_path = None
         
         if usdz_result and not isinstance(usdz_result, Exception):
             usdz_path = usdz_result
             formats_generated.append("usdz")
-            print(f"[Pipeline Step 4] ✓ USDZ generated: {usdz_path}")
+            logger.info("[Pipeline Step 4] ✓ USDZ generated: %s", usdz_path)
         else:
             if isinstance(usdz_result, Exception):
-                print(f"[Pipeline Step 4] ⚠ USDZ conversion failed: {usdz_result}")
+                logger.warning("[Pipeline Step 4] ⚠ USDZ conversion failed: %s", usdz_result)
             else:
-                print(f"[Pipeline Step 4] ⚠ USDZ conversion skipped (MVP)")
+                logger.info("[Pipeline Step 4] ⚠ USDZ conversion skipped (MVP)")
             usdz_path = None
         
         # [STEP 7] Prepare result
@@ -432,21 +646,26 @@ async def generate_3d_assets(image_path: str) -> Dict[str, Any]:
             "glb_path": glb_path,
             "mp4_path": mp4_path,
             "usdz_path": usdz_path,
-            "preview_renders": preview_urls,
+            "preview_renders": preview_renders,
             "preprocessed_image_path": preprocessed_path,
             "status": "completed",
             "processing_time": round(processing_time, 2),
             "formats_generated": formats_generated
         }
         
-        print(f"[Pipeline Step 4] ✓ 3D assets generated in {processing_time:.1f}s")
-        print(f"[Pipeline Step 4] Formats: {', '.join(formats_generated)}")
-        
+        logger.info("[Pipeline Step 4] ✓ 3D assets generated in %.1fs", processing_time)
+        logger.info("[Pipeline Step 4] Formats: %s", ", ".join(formats_generated))
+
+        # Awaited rather than spawned: an unreferenced create_task can be
+        # garbage-collected mid-flight, and the write is one small SQLite
+        # statement anyway
+        await save_to_cache(image_path, result)
+
         return result
         
     except Exception as e:
         processing_time = time.time() - start_time
-        print(f"[Pipeline Step 4] ✗ Error: {str(e)}")
+        logger.error("[Pipeline Step 4] ✗ Error: %s", e)
         
         # Return partial results if available
         return {
@@ -477,77 +696,87 @@ async def export_listing(all_pipeline_data: Dict[str, Any]) -> Dict[str, Any]:
         }
     """
     try:
-        print(f"[Pipeline Step 5] Exporting listing data...")
+        logger.info("[Pipeline Step 5] Exporting listing data...")
         
         import uuid
         listing_id = str(uuid.uuid4())
         
+        # Bind the shared pieces once instead of re-subscripting
+        # all_pipeline_data thirty-odd times below
+        content = all_pipeline_data["content"]
+        assets_3d = all_pipeline_data["assets_3d"]
+        niche_name = all_pipeline_data["image_analysis"]["niche"]["name"]
+        price = all_pipeline_data["price"]["estimated_price"]
+        glb_path = assets_3d.get("glb_path")
+        mp4_path = assets_3d.get("mp4_path")
+        preview_renders = assets_3d.get("preview_renders", [])
+        
         # Create marketplace-specific exports
         export_formats = {
             "ebay": {
-                "title": all_pipeline_data["content"]["title"],
-                "description": all_pipeline_data["content"]["description"],
-                "category": all_pipeline_data["image_analysis"]["niche"]["name"],
-                "price": all_pipeline_data["price"]["estimated_price"],
+                "title": content["title"],
+                "description": content["description"],
+                "category": niche_name,
+                "price": price,
                 "condition": "New",
                 "listing_type": "FixedPrice",
                 "media": {
-                    "video": all_pipeline_data["assets_3d"].get("mp4_path"),
-                    "images": all_pipeline_data["assets_3d"].get("preview_renders", [])
+                    "video": mp4_path,
+                    "images": preview_renders
                 }
             },
             "amazon": {
-                "product_name": all_pipeline_data["content"]["title"],
-                "description": all_pipeline_data["content"]["description"],
-                "bullet_points": all_pipeline_data["content"]["bullet_points"],
-                "keywords": all_pipeline_data["content"]["tags"],
-                "price": all_pipeline_data["price"]["estimated_price"],
+                "product_name": content["title"],
+                "description": content["description"],
+                "bullet_points": content["bullet_points"],
+                "keywords": content["tags"],
+                "price": price,
                 "media": {
-                    "3d_model": all_pipeline_data["assets_3d"].get("glb_path"),  # Amazon supports GLB
-                    "video": all_pipeline_data["assets_3d"].get("mp4_path"),
-                    "images": all_pipeline_data["assets_3d"].get("preview_renders", [])
+                    "3d_model": glb_path,  # Amazon supports GLB
+                    "video": mp4_path,
+                    "images": preview_renders
                 }
             },
             "mercado_livre": {
-                "titulo": all_pipeline_data["content"]["title"],
-                "descricao": all_pipeline_data["content"]["description"],
-                "categoria": all_pipeline_data["image_analysis"]["niche"]["name"],
-                "preco": all_pipeline_data["price"]["estimated_price"],
+                "titulo": content["title"],
+                "descricao": content["description"],
+                "categoria": niche_name,
+                "preco": price,
                 "moeda": "USD",
                 "midia": {
-                    "video": all_pipeline_data["assets_3d"].get("mp4_path"),
-                    "imagens": all_pipeline_data["assets_3d"].get("preview_renders", [])
+                    "video": mp4_path,
+                    "imagens": preview_renders
                 }
             }
         }
         
-        # Save export data
+        # Save export data — orjson serializes straight to bytes and the
+        # aiofiles write keeps the event loop free during the disk flush
         export_file = f"data/exports/listing_{listing_id}.json"
-        os.makedirs("data/exports", exist_ok=True)
         
-        with open(export_file, 'w', encoding='utf-8') as f:
-            json.dump({
+        async with aiofiles.open(export_file, 'wb') as f:
+            await f.write(orjson.dumps({
                 "listing_id": listing_id,
                 "pipeline_data": all_pipeline_data,
                 "exports": export_formats
-            }, f, indent=2, ensure_ascii=False)
+            }, option=orjson.OPT_INDENT_2))
         
         result = {
             "listing_id": listing_id,
             "export_formats": export_formats,
             "files": {
                 "json": export_file,
-                "glb_3d_model": all_pipeline_data["assets_3d"].get("glb_path"),
-                "mp4_video": all_pipeline_data["assets_3d"].get("mp4_path"),
-                "usdz_ar_model": all_pipeline_data["assets_3d"].get("usdz_path"),
-                "preview_renders": all_pipeline_data["assets_3d"].get("preview_renders", []),
-                "processed_image": all_pipeline_data["assets_3d"].get("preprocessed_image_path")
+                "glb_3d_model": glb_path,
+                "mp4_video": mp4_path,
+                "usdz_ar_model": assets_3d.get("usdz_path"),
+                "preview_renders": preview_renders,
+                "processed_image": assets_3d.get("preprocessed_image_path")
             }
         }
         
-        print(f"[Pipeline Step 5] ✓ Listing exported: {listing_id}")
+        logger.info("[Pipeline Step 5] ✓ Listing exported: %s", listing_id)
         return result
         
     except Exception as e:
-        print(f"[Pipeline Step 5] ✗ Error: {str(e)}")
+        logger.error("[Pipeline Step 5] ✗ Error: %s", e)
         raise
@@ -3,56 +3,66 @@ Database models and utilities for user management.
 This module provides a bridge between the Python backend and the Next.js Prisma database.
 """
 import os
+import secrets
 import sqlite3
+import threading
+import time
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Path to the Next.js Prisma database
 DB_PATH = Path(__file__).parent.parent.parent / "frontend-next" / "dev.db"
 
 
+def _now_iso() -> str:
+    """ISO-8601 UTC timestamp straight from the clock syscall."""
+    return datetime.fromtimestamp(time.time_ns() / 1e9, tz=timezone.utc).isoformat()
+
+
 class UserDatabase:
     """Interface to interact with the Next.js user database."""
     
     def __init__(self, db_path: str = None):
         self.db_path = db_path or str(DB_PATH)
+        self._local = threading.local()
     
     def get_connection(self):
-        """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        """
+        Get a database connection.
+
+        Connections are cached per thread — opening one reparses the
+        schema and takes a file lock, which dominated deduct_credits
+        under load. WAL lets concurrent readers proceed during writes.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
     
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email."""
-        conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "SELECT id, email, name, credits, createdAt FROM User WHERE email = ?",
-                (email,)
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
-        finally:
-            conn.close()
+        cursor = self.get_connection().cursor()
+        cursor.execute(
+            "SELECT id, email, name, credits, createdAt FROM User WHERE email = ?",
+            (email,)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
     
     def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID."""
-        conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "SELECT id, email, name, credits, createdAt FROM User WHERE id = ?",
-                (user_id,)
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
-        finally:
-            conn.close()
+        cursor = self.get_connection().cursor()
+        cursor.execute(
+            "SELECT id, email, name, credits, createdAt FROM User WHERE id = ?",
+            (user_id,)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
     
     def deduct_credits(self, user_id: str, amount: int = 1) -> bool:
         """
@@ -60,37 +70,61 @@ class UserDatabase:
         Returns True if successful, False if insufficient credits.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        try:
-            # Check current credits
-            cursor.execute("SELECT credits FROM User WHERE id = ?", (user_id,))
-            row = cursor.fetchone()
+        # Guarded UPDATE inside one transaction: rowcount tells us whether
+        # the user had enough credits, with no SELECT-then-UPDATE race
+        with conn:
+            cursor = conn.execute(
+                "UPDATE User SET credits = credits - ? WHERE id = ? AND credits >= ?",
+                (amount, user_id, amount)
+            )
             
-            if not row or row[0] < amount:
+            if cursor.rowcount == 0:
                 return False
             
-            # Deduct credits
+            # Log transaction
+            conn.execute(
+                """INSERT INTO "Transaction" (id, userId, type, amount, description, createdAt)
+                   VALUES (?, ?, 'deduction', ?, 'Image upload and 3D generation', ?)""",
+                (self._generate_cuid(), user_id, -amount, _now_iso())
+            )
+        
+        return True
+    
+    def try_deduct_credit_atomic(self, user_id: str) -> Optional[int]:
+        """
+        Deduct one credit in a single atomic statement.
+        Returns the remaining credit count, or None if the user doesn't
+        exist or has no credits. The guarded UPDATE...RETURNING avoids
+        the SELECT-then-UPDATE race and costs one round-trip.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
             cursor.execute(
-                "UPDATE User SET credits = credits - ? WHERE id = ?",
-                (amount, user_id)
+                "UPDATE User SET credits = credits - 1 "
+                "WHERE id = ? AND credits >= 1 RETURNING credits",
+                (user_id,)
             )
-            
+            row = cursor.fetchone()
+
+            if row is None:
+                return None
+
             # Log transaction
             cursor.execute(
-                """INSERT INTO Transaction (id, userId, type, amount, description, createdAt)
-                   VALUES (?, ?, 'deduction', ?, 'Image upload and 3D generation', ?)""",
-                (self._generate_cuid(), user_id, -amount, datetime.utcnow().isoformat())
+                """INSERT INTO "Transaction" (id, userId, type, amount, description, createdAt)
+                   VALUES (?, ?, 'deduction', -1, 'Image upload and 3D generation', ?)""",
+                (self._generate_cuid(), user_id, _now_iso())
             )
-            
+
             conn.commit()
-            return True
+            return row[0]
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
-            conn.close()
-    
+
     def refund_credits(self, user_id: str, amount: int = 1, reason: str = "Generation failed"):
         """Refund credits to a user."""
         conn = self.get_connection()
@@ -104,14 +138,15 @@ class UserDatabase:
             
             # Log transaction
             cursor.execute(
-                """INSERT INTO Transaction (id, userId, type, amount, description, createdAt)
+                """INSERT INTO "Transaction" (id, userId, type, amount, description, createdAt)
                    VALUES (?, ?, 'refund', ?, ?, ?)""",
-                (self._generate_cuid(), user_id, amount, reason, datetime.utcnow().isoformat())
+                (self._generate_cuid(), user_id, amount, reason, _now_iso())
             )
             
             conn.commit()
-        finally:
-            conn.close()
+        except Exception as e:
+            conn.rollback()
+            raise e
     
     def save_listing(
         self,
@@ -146,13 +181,14 @@ class UserDatabase:
                     usdz_url,
                     price,
                     keywords,
-                    datetime.utcnow().isoformat(),
+                    _now_iso(),
                 )
             )
             conn.commit()
             return listing_id
-        finally:
-            conn.close()
+        except Exception as e:
+            conn.rollback()
+            raise e
     
     def add_credits_from_payment(
         self,
@@ -182,7 +218,7 @@ class UserDatabase:
         try:
             # Check if this payment was already processed (idempotency)
             cursor.execute(
-                "SELECT id FROM Transaction WHERE stripeId = ?",
+                'SELECT id FROM "Transaction" WHERE stripeId = ?',
                 (stripe_session_id,)
             )
             if cursor.fetchone():
@@ -197,7 +233,7 @@ class UserDatabase:
             # Log transaction
             description = f"Purchased {package_id} pack: {credits} credits (${amount_paid:.2f})"
             cursor.execute(
-                """INSERT INTO Transaction (id, userId, type, amount, stripeId, description, createdAt)
+                """INSERT INTO "Transaction" (id, userId, type, amount, stripeId, description, createdAt)
                    VALUES (?, ?, 'purchase', ?, ?, ?, ?)""",
                 (
                     self._generate_cuid(),
@@ -205,7 +241,7 @@ class UserDatabase:
                     credits,
                     stripe_session_id,
                     description,
-                    datetime.utcnow().isoformat()
+                    _now_iso()
                 )
             )
             
@@ -214,19 +250,13 @@ class UserDatabase:
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
-            conn.close()
     
     @staticmethod
     def _generate_cuid() -> str:
         """Generate a simple unique ID (simplified version of cuid)."""
-        import time
-        import random
-        import string
-        
-        timestamp = hex(int(time.time() * 1000))[2:]
-        random_part = ''.join(random.choices(string.ascii_lowercase + string.digits, k=16))
-        return f"c{timestamp}{random_part}"
+        # ns-resolution timestamp plus OS-entropy suffix: collision-safe
+        # across processes, and both parts are single C calls
+        return f"c{time.time_ns():x}{secrets.token_hex(8)}"
 
 
 # Singleton instance
@@ -18,6 +18,48 @@ CREATE TABLE IF NOT EXISTS keywords (
     FOREIGN KEY (niche_id) REFERENCES niches (id)
 );
 
+-- Dedupes learned keywords in C (via ON CONFLICT) instead of Python
+CREATE UNIQUE INDEX IF NOT EXISTS idx_keywords_niche_keyword
+    ON keywords (niche_id, keyword);
+
+-- KV cache of 3D generation results keyed by image content hash
+CREATE TABLE IF NOT EXISTS asset_cache (
+    hash TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    created_at INTEGER NOT NULL
+);
+
+-- KV cache of complete /upload pipeline outputs keyed by image content hash
+CREATE TABLE IF NOT EXISTS pipeline_cache (
+    hash TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    created_at INTEGER NOT NULL
+);
+
+-- KV cache of generated listing copy keyed by (niche, labels, price bucket)
+CREATE TABLE IF NOT EXISTS content_cache (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    created_at INTEGER NOT NULL
+);
+
+-- Status/result rows for background 3D generation jobs (polled by the
+-- frontend via GET /listings/{id}/status)
+CREATE TABLE IF NOT EXISTS listing_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending', -- 'pending', 'completed' or 'failed'
+    result TEXT, -- JSON of the final listing payload
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Small key/value store for bookkeeping (e.g. the seed-payload hash)
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     product_id INTEGER NOT NULL,
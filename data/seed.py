@@ -1,78 +1,148 @@
-from backend.database import get_db_connection, init_db
+from backend.database import DB_PATH, SCHEMA_PATH
+import hashlib
 import os
+import sqlite3
+import sys
+from pathlib import Path
+
+# The entire seed payload as one static constant: (name, description,
+# keywords) per niche, built once at import. seed_data() just derives
+# its insert batches from this with comprehensions. Names and keywords
+# are interned below since each name is bound once per keyword row
+_RAW_SEED_ROWS = (
+    ("Fitness & Wellness", "Yoga, gym, workout gear, supplements, health.",
+     ("yoga", "gym", "dumbbell", "mat", "protein", "workout", "sport", "run", "fitness", "exercise")),
+    ("Pet Supplies", "Toys, food, accessories for dogs, cats, and other pets.",
+     ("dog", "cat", "pet", "toy", "food", "leash", "collar", "animal", "puppy", "kitten")),
+    ("Home Office", "Desks, chairs, computers, productivity tools.",
+     ("desk", "chair", "computer", "laptop", "monitor", "keyboard", "mouse", "office", "work")),
+    ("Beauty & Personal Care", "Makeup, skincare, grooming, bath products.",
+     ("makeup", "lipstick", "cream", "skin", "hair", "brush", "perfume", "soap", "lotion")),
+    ("Tech Accessories", "Phone cases, chargers, cables, gadgets.",
+     ("phone", "case", "charger", "cable", "usb", "headphone", "earbud", "battery", "screen")),
+    ("Outdoor & Adventure", "Camping gear, hiking equipment, travel essentials.",
+     ("tent", "backpack", "hike", "camp", "sleeping", "boot", "compass", "map", "nature")),
+    ("Kitchen & Dining", "Cookware, utensils, appliances, tableware.",
+     ("pan", "pot", "knife", "spoon", "fork", "plate", "bowl", "cup", "mug", "chef")),
+    ("Fashion & Apparel", "Clothing, shoes, accessories, style.",
+     ("shirt", "pants", "dress", "shoe", "hat", "jacket", "jeans", "clothing", "wear")),
+    ("Gaming", "Consoles, controllers, headsets, video games.",
+     ("game", "console", "controller", "joystick", "headset", "xbox", "playstation", "nintendo")),
+    ("Home Decor", "Furniture, lighting, rugs, decoration.",
+     ("sofa", "lamp", "rug", "vase", "pillow", "curtain", "mirror", "furniture", "room")),
+    ("Baby & Kids", "Toys, diapers, strollers, baby care.",
+     ("baby", "diaper", "toy", "stroller", "crib", "bottle", "pacifier", "kid", "child")),
+    ("Automotive", "Car accessories, tools, maintenance.",
+     ("car", "tire", "wheel", "oil", "tool", "vehicle", "auto", "drive")),
+    ("Gardening", "Plants, tools, seeds, outdoor living.",
+     ("plant", "flower", "garden", "shovel", "pot", "soil", "seed", "grow", "green")),
+    ("Books & Media", "Books, vinyl, movies, music.",
+     ("book", "novel", "read", "vinyl", "record", "music", "movie", "cd", "paper")),
+    ("Art & Crafts", "Paint, brushes, yarn, DIY supplies.",
+     ("paint", "brush", "canvas", "draw", "pencil", "yarn", "knit", "craft", "art")),
+)
+
+SEED_ROWS = tuple(
+    (sys.intern(name), description, tuple(map(sys.intern, keywords)))
+    for name, description, keywords in _RAW_SEED_ROWS
+)
+
+# Fingerprint of the seed payload, stored in the meta table so repeat
+# runs against an up-to-date database can skip the rebuild entirely
+SEED_HASH = hashlib.sha256(repr(_RAW_SEED_ROWS).encode()).hexdigest()
+
+def _already_seeded() -> bool:
+    """True if the on-disk database carries the current seed hash."""
+    if not os.path.exists(DB_PATH):
+        return False
+    try:
+        existing = sqlite3.connect(DB_PATH)
+        try:
+            row = existing.execute(
+                "SELECT value FROM meta WHERE key = 'seed_hash'"
+            ).fetchone()
+        finally:
+            existing.close()
+    except sqlite3.Error:
+        # Unreadable or pre-meta database — rebuild it
+        return False
+    return row is not None and row[0] == SEED_HASH
+
 
 def seed_data():
-    # Reset database
-    if os.path.exists("data/promotia.db"):
-        os.remove("data/promotia.db")
-    
-    init_db()
-    conn = get_db_connection()
+    if _already_seeded():
+        print("Seed data unchanged, skipping reseed.")
+        return
+
+    # Reset database — one unlink syscall each, no exists() pre-check,
+    # and clear stale WAL/SHM sidecars so they can't shadow the new file
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{DB_PATH}{suffix}").unlink(missing_ok=True)
+    os.makedirs("data", exist_ok=True)
+
+    # Build the database entirely in memory — no journal, no fsync —
+    # then stream the finished pages to disk once via the backup API.
+    # isolation_level=None disables the driver's statement sniffing; we
+    # manage the transaction ourselves with an explicit BEGIN/commit
+    conn = sqlite3.connect(":memory:", isolation_level=None)
     cursor = conn.cursor()
+    with open(SCHEMA_PATH, "r") as f:
+        cursor.executescript(f.read())
+
+    # Classic bulk-load ordering: drop the keyword index, insert, then
+    # recreate it so SQLite builds the B-tree from one sorted scan
+    # instead of maintaining it per row (DDL mirrors data/schema.sql)
+    cursor.execute("DROP INDEX IF EXISTS idx_keywords_niche_keyword")
+
+    # One explicit transaction around the whole load; IMMEDIATE takes
+    # the write lock up front instead of upgrading mid-insert
+    cursor.execute("BEGIN IMMEDIATE")
 
-    niches = [
-        ("Fitness & Wellness", "Yoga, gym, workout gear, supplements, health."),
-        ("Pet Supplies", "Toys, food, accessories for dogs, cats, and other pets."),
-        ("Home Office", "Desks, chairs, computers, productivity tools."),
-        ("Beauty & Personal Care", "Makeup, skincare, grooming, bath products."),
-        ("Tech Accessories", "Phone cases, chargers, cables, gadgets."),
-        ("Outdoor & Adventure", "Camping gear, hiking equipment, travel essentials."),
-        ("Kitchen & Dining", "Cookware, utensils, appliances, tableware."),
-        ("Fashion & Apparel", "Clothing, shoes, accessories, style."),
-        ("Gaming", "Consoles, controllers, headsets, video games."),
-        ("Home Decor", "Furniture, lighting, rugs, decoration."),
-        ("Baby & Kids", "Toys, diapers, strollers, baby care."),
-        ("Automotive", "Car accessories, tools, maintenance."),
-        ("Gardening", "Plants, tools, seeds, outdoor living."),
-        ("Books & Media", "Books, vinyl, movies, music."),
-        ("Art & Crafts", "Paint, brushes, yarn, DIY supplies.")
+    # No try/except here on purpose: the database was just recreated, so
+    # any failure is a schema regression that should raise loudly rather
+    # than be swallowed row by row
+    cursor.executemany(
+        "INSERT INTO niches (name, description) VALUES (?, ?)",
+        [(name, desc) for name, desc, _ in SEED_ROWS]
+    )
+
+    # Keywords go in as one statement: a multi-row VALUES list joined
+    # against niches resolves every niche_id inside SQLite, so there
+    # is no per-niche lastrowid round-trip and only two FFI crossings
+    # for the whole load. One flat comprehension builds the bound
+    # parameters directly — no intermediate list of row tuples
+    params = [
+        value
+        for name, _, keywords in SEED_ROWS
+        for kw in keywords
+        for value in (name, kw)
     ]
+    placeholders = ",".join(["(?, ?)"] * (len(params) // 2))
+    cursor.execute(
+        "INSERT INTO keywords (niche_id, keyword) "
+        f"SELECT niches.id, kw.column2 FROM (VALUES {placeholders}) AS kw "
+        "JOIN niches ON niches.name = kw.column1",
+        params
+    )
 
-    for name, desc in niches:
-        try:
-            cursor.execute("INSERT INTO niches (name, description) VALUES (?, ?)", (name, desc))
-            niche_id = cursor.lastrowid
-            
-            # Add keywords for each niche
-            keywords = []
-            if name == "Fitness & Wellness":
-                keywords = ["yoga", "gym", "dumbbell", "mat", "protein", "workout", "sport", "run", "fitness", "exercise"]
-            elif name == "Pet Supplies":
-                keywords = ["dog", "cat", "pet", "toy", "food", "leash", "collar", "animal", "puppy", "kitten"]
-            elif name == "Home Office":
-                keywords = ["desk", "chair", "computer", "laptop", "monitor", "keyboard", "mouse", "office", "work"]
-            elif name == "Beauty & Personal Care":
-                keywords = ["makeup", "lipstick", "cream", "skin", "hair", "brush", "perfume", "soap", "lotion"]
-            elif name == "Tech Accessories":
-                keywords = ["phone", "case", "charger", "cable", "usb", "headphone", "earbud", "battery", "screen"]
-            elif name == "Outdoor & Adventure":
-                keywords = ["tent", "backpack", "hike", "camp", "sleeping", "boot", "compass", "map", "nature"]
-            elif name == "Kitchen & Dining":
-                keywords = ["pan", "pot", "knife", "spoon", "fork", "plate", "bowl", "cup", "mug", "chef"]
-            elif name == "Fashion & Apparel":
-                keywords = ["shirt", "pants", "dress", "shoe", "hat", "jacket", "jeans", "clothing", "wear"]
-            elif name == "Gaming":
-                keywords = ["game", "console", "controller", "joystick", "headset", "xbox", "playstation", "nintendo"]
-            elif name == "Home Decor":
-                keywords = ["sofa", "lamp", "rug", "vase", "pillow", "curtain", "mirror", "furniture", "room"]
-            elif name == "Baby & Kids":
-                keywords = ["baby", "diaper", "toy", "stroller", "crib", "bottle", "pacifier", "kid", "child"]
-            elif name == "Automotive":
-                keywords = ["car", "tire", "wheel", "oil", "tool", "vehicle", "auto", "drive"]
-            elif name == "Gardening":
-                keywords = ["plant", "flower", "garden", "shovel", "pot", "soil", "seed", "grow", "green"]
-            elif name == "Books & Media":
-                keywords = ["book", "novel", "read", "vinyl", "record", "music", "movie", "cd", "paper"]
-            elif name == "Art & Crafts":
-                keywords = ["paint", "brush", "canvas", "draw", "pencil", "yarn", "knit", "craft", "art"]
-            
-            for kw in keywords:
-                cursor.execute("INSERT INTO keywords (niche_id, keyword) VALUES (?, ?)", (niche_id, kw))
-                
-        except Exception as e:
-            print(f"Skipping {name}: {e}")
+    cursor.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('seed_hash', ?)",
+        (SEED_HASH,)
+    )
 
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_keywords_niche_keyword "
+        "ON keywords (niche_id, keyword)"
+    )
     conn.commit()
+
+    disk = sqlite3.connect(DB_PATH)
+    # Seeding is single-writer and single-process, so the target can
+    # hold the file lock for the whole backup instead of re-acquiring
+    # it per batch of pages
+    disk.execute("PRAGMA locking_mode=EXCLUSIVE")
+    conn.backup(disk)
+    disk.close()
     conn.close()
     print("Database reset and seeded with Expanded Marketing Niches successfully.")
 